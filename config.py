@@ -17,10 +17,14 @@ if TESTING:
     BOOKS_STORAGE_FILE = ':memory:'
     USERS_STORAGE_FILE = ':memory:'
     CHECKOUTS_STORAGE_FILE = ':memory:'
+    LEGACY_CHECKOUTS_STORAGE_FILE = ':memory:'
 else:
     # In production mode, use JSON files for persistent storage
     # os.path.join is used to create cross-platform compatible file paths
     BOOKS_STORAGE_FILE = os.path.join(BASE_DIR, 'books_data.json')
     USERS_STORAGE_FILE = os.path.join(BASE_DIR, 'users_data.json')
-    CHECKOUTS_STORAGE_FILE = os.path.join(BASE_DIR, 'checkouts_data.json')
+    # Checkouts are kept as an append-only log with one JSON record per line
+    CHECKOUTS_STORAGE_FILE = os.path.join(BASE_DIR, 'checkouts_data.jsonl')
+    # Older versions kept checkouts as a single JSON list; it is migrated to the log on first load
+    LEGACY_CHECKOUTS_STORAGE_FILE = os.path.join(BASE_DIR, 'checkouts_data.json')
 
@@ -1,14 +1,15 @@
-from abc import ABC, abstractmethod
-
-class LibraryItem(ABC):
+class LibraryItem:
     """
-    Abstract base class for library items.
+    Base class for library items.
 
     This class defines the common attributes and methods for all library items.
-    It uses the ABC module to create an abstract base class, ensuring that
-    child classes implement certain methods.
+    Child classes must implement __str__, to_dict and from_dict. It is a plain
+    class rather than an ABC so that creating items does not go through the
+    ABCMeta instantiation checks.
     """
 
+    __slots__ = ('_title', '_isbn', '_available', '_cached_dict')
+
     def __init__(self, title: str, isbn: str):
         """
         Initialize a LibraryItem.
@@ -20,12 +21,19 @@ class LibraryItem(ABC):
         self._title = title
         self._isbn = isbn
         self._available = True  # Items are available by default when created
+        self._cached_dict = None  # Serialized form, rebuilt after any change
 
     @property
     def title(self) -> str:
         """Get the title of the library item."""
         return self._title
 
+    @title.setter
+    def title(self, value: str):
+        """Set the title of the library item, refreshing anything derived from it."""
+        self._title = value
+        self._invalidate()
+
     @property
     def isbn(self) -> str:
         """Get the ISBN of the library item."""
@@ -40,27 +48,29 @@ class LibraryItem(ABC):
     def available(self, value: bool):
         """Set the availability status of the library item."""
         self._available = value
+        self._cached_dict = None
+
+    def _invalidate(self):
+        """Drop the cached dictionary after the item's data changes."""
+        self._cached_dict = None
 
-    @abstractmethod
     def __str__(self) -> str:
         """
         Return a string representation of the library item.
 
         This method must be implemented by all subclasses.
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def to_dict(self) -> dict:
         """
         Convert the library item to a dictionary.
 
         This method must be implemented by all subclasses and is used for serialization.
         """
-        pass
+        raise NotImplementedError
 
     @classmethod
-    @abstractmethod
     def from_dict(cls, data: dict):
         """
         Create a library item from a dictionary.
@@ -70,15 +80,17 @@ class LibraryItem(ABC):
         Args:
             data (dict): A dictionary containing the library item's data.
         """
-        pass
+        raise NotImplementedError
 
 class Book(LibraryItem):
     """
     Represents a book in the library system.
 
-    This class inherits from LibraryItem and implements its abstract methods.
+    This class inherits from LibraryItem and implements its serialization methods.
     """
 
+    __slots__ = ('_author', '_search_blob')
+
     def __init__(self, title: str, author: str, isbn: str):
         """
         Initialize a Book.
@@ -90,12 +102,25 @@ class Book(LibraryItem):
         """
         super().__init__(title, isbn)
         self._author = author
+        # Lowercased "title\0author" matched by BookManager.search_books
+        self._search_blob = f"{title}\0{author}".casefold()
 
     @property
     def author(self) -> str:
         """Get the author of the book."""
         return self._author
 
+    @author.setter
+    def author(self, value: str):
+        """Set the author of the book, keeping the search key and cached dictionary in sync."""
+        self._author = value
+        self._invalidate()
+
+    def _invalidate(self):
+        """Rebuild the search key and drop the cached dictionary after the title or author changes."""
+        self._search_blob = f"{self._title}\0{self._author}".casefold()
+        self._cached_dict = None
+
     def __str__(self) -> str:
         """
         Return a string representation of the book.
@@ -109,15 +134,20 @@ class Book(LibraryItem):
         """
         Convert the book to a dictionary.
 
+        The dictionary is cached until the book changes, so saving a catalog
+        only rebuilds the entries of books that were modified.
+
         Returns:
             dict: A dictionary containing the book's data.
         """
-        return {
-            "title": self.title,
-            "author": self.author,
-            "isbn": self.isbn,
-            "available": self.available
-        }
+        if self._cached_dict is None:
+            self._cached_dict = {
+                "title": self.title,
+                "author": self.author,
+                "isbn": self.isbn,
+                "available": self.available
+            }
+        return self._cached_dict
 
     @classmethod
     def from_dict(cls, data: dict):
@@ -130,6 +160,30 @@ class Book(LibraryItem):
         Returns:
             Book: A new Book instance created from the provided data.
         """
-        book = cls(data["title"], data["author"], data["isbn"])
-        book.available = data["available"]
+        return cls._from_loaded(data["title"], data["author"], data["isbn"], data["available"])
+
+    @classmethod
+    def _from_loaded(cls, title: str, author: str, isbn: str, available: bool):
+        """
+        Create a Book instance from already unpacked stored fields.
+
+        This is the fast path used when loading a whole catalog from storage:
+        it fills in the slots directly instead of running __init__ and then
+        overwriting the availability.
+
+        Args:
+            title (str): The title of the book.
+            author (str): The author of the book.
+            isbn (str): The ISBN of the book.
+            available (bool): Whether the book is available for checkout.
+
+        Returns:
+            Book: A new Book instance created from the provided fields.
+        """
+        book = cls.__new__(cls)
+        book._title = title
+        book._isbn = isbn
+        book._available = available
+        book._author = author
+        book._invalidate()
         return book
\ No newline at end of file
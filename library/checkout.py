@@ -8,6 +8,8 @@ class Checkout:
     the book itself, and the relevant dates.
     """
 
+    __slots__ = ('user', 'book', '_checkout_date', '_checkout_iso', '_due_date', '_due_iso', '_due_str')
+
     def __init__(self, user, book):
         """
         Initialize a Checkout.
@@ -21,6 +23,29 @@ class Checkout:
         self.checkout_date = datetime.now()
         self.due_date = self.checkout_date + timedelta(days=14)  # 2 weeks checkout period
 
+    @property
+    def checkout_date(self) -> datetime:
+        """Get the date the book was checked out."""
+        return self._checkout_date
+
+    @checkout_date.setter
+    def checkout_date(self, value: datetime):
+        """Set the checkout date, caching its ISO form used for serialization."""
+        self._checkout_date = value
+        self._checkout_iso = value.isoformat()
+
+    @property
+    def due_date(self) -> datetime:
+        """Get the date the book is due back."""
+        return self._due_date
+
+    @due_date.setter
+    def due_date(self, value: datetime):
+        """Set the due date, caching the formatted strings used for display and serialization."""
+        self._due_date = value
+        self._due_iso = value.isoformat()
+        self._due_str = value.strftime('%Y-%m-%d')
+
     def __str__(self) -> str:
         """
         Return a string representation of the checkout.
@@ -30,7 +55,7 @@ class Checkout:
         """
         user_name = self.user.name if self.user else "Unknown User"
         book_title = self.book.title if self.book else "Unknown Book"
-        return f"{book_title} checked out by {user_name} until {self.due_date.strftime('%Y-%m-%d')}"
+        return f"{book_title} checked out by {user_name} until {self._due_str}"
 
     def to_dict(self) -> dict:
         """
@@ -42,8 +67,8 @@ class Checkout:
         return {
             "user_id": self.user.user_id if self.user else None,
             "book_isbn": self.book.isbn if self.book else None,
-            "checkout_date": self.checkout_date.isoformat(),
-            "due_date": self.due_date.isoformat()
+            "checkout_date": self._checkout_iso,
+            "due_date": self._due_iso
         }
 
     @classmethod
@@ -61,7 +86,28 @@ class Checkout:
         """
         user = user_manager.get_user_by_id(data["user_id"]) if data["user_id"] else None
         book = book_manager.get_book_by_isbn(data["book_isbn"]) if data["book_isbn"] else None
-        checkout = cls(user, book)
-        checkout.checkout_date = datetime.fromisoformat(data["checkout_date"])
-        checkout.due_date = datetime.fromisoformat(data["due_date"])
+        return cls._from_loaded(user, book, data["checkout_date"], data["due_date"])
+
+    @classmethod
+    def _from_loaded(cls, user, book, checkout_date: str, due_date: str):
+        """
+        Create a Checkout instance from an already resolved user and book.
+
+        This is the fast path used when loading all checkouts from storage:
+        it bypasses __init__, whose current-time dates would be overwritten anyway.
+
+        Args:
+            user: The User who checked out the book.
+            book: The Book that was checked out.
+            checkout_date (str): The checkout date in ISO format.
+            due_date (str): The due date in ISO format.
+
+        Returns:
+            Checkout: A new Checkout instance created from the provided fields.
+        """
+        checkout = cls.__new__(cls)
+        checkout.user = user
+        checkout.book = book
+        checkout.checkout_date = datetime.fromisoformat(checkout_date)
+        checkout.due_date = datetime.fromisoformat(due_date)
         return checkout
\ No newline at end of file
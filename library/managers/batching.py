@@ -0,0 +1,49 @@
+from contextlib import contextmanager
+
+class BatchSaveMixin:
+    """
+    Mixin that lets a manager defer writes to storage.
+
+    Managers mark themselves dirty after every change. Outside of a batch the
+    change is written straight away; inside batch() the write is postponed
+    until the outermost batch exits, so bulk operations pay for a single write.
+    Subclasses implement _write() to persist their data.
+    """
+
+    _dirty = False
+    _batch_depth = 0
+
+    def _mark_dirty(self):
+        """Record that there are unsaved changes and write them unless batching."""
+        self._dirty = True
+        if not self._batch_depth:
+            self.flush()
+
+    def _write(self):
+        """Write the manager's data to storage. Must be implemented by subclasses."""
+        raise NotImplementedError
+
+    def flush(self):
+        """Write pending changes to storage, if there are any."""
+        if self._dirty:
+            self._dirty = False
+            self._write()
+
+    @contextmanager
+    def batch(self):
+        """
+        Defer writes until the end of the block.
+
+        Batches can be nested; pending changes are flushed when the outermost
+        batch exits, even if the block raised.
+
+        Yields:
+            The manager itself.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
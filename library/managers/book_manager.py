@@ -1,8 +1,10 @@
+from collections.abc import Mapping
 from library.book import Book
 from library.storage import Storage
+from library.managers.batching import BatchSaveMixin
 import config
 
-class BookManager:
+class BookManager(BatchSaveMixin):
     """
     Manages the collection of books in the library system.
 
@@ -19,7 +21,32 @@ class BookManager:
                                          If not provided, a new one will be created.
         """
         self.storage = storage or Storage(config.BOOKS_STORAGE_FILE)
-        self.books = self._load_books()
+        self._books = None  # Loaded from storage on first access
+
+    @property
+    def books(self) -> dict:
+        """
+        Get the books in the library, loading them on first access.
+
+        Returns:
+            dict: The Book objects keyed by ISBN, in the order they were added.
+        """
+        if self._books is None:
+            self.books = self._load_books()
+        return self._books
+
+    @books.setter
+    def books(self, books):
+        """
+        Replace the books in the library.
+
+        Args:
+            books: An iterable of Book objects, or a mapping of them such as
+                the dict returned by the getter.
+        """
+        if isinstance(books, Mapping):
+            books = books.values()
+        self._books = {book.isbn: book for book in books}
 
     def _load_books(self):
         """
@@ -29,11 +56,16 @@ class BookManager:
             list: A list of Book objects.
         """
         data = self.storage.load_data()
-        return [Book.from_dict(book_data) for book_data in data]
+        from_loaded = Book._from_loaded
+        return [from_loaded(d["title"], d["author"], d["isbn"], d["available"]) for d in data]
 
     def save_books(self):
-        """Save the current list of books to storage."""
-        self.storage.save_data([book.to_dict() for book in self.books])
+        """Save the current list of books to storage, deferred while a batch is open."""
+        self._mark_dirty()
+
+    def _write(self):
+        """Write the current list of books to storage."""
+        self.storage.save_data([book.to_dict() for book in self.books.values()])
 
     def add_book(self, title: str, author: str, isbn: str) -> Book:
         """
@@ -52,10 +84,10 @@ class BookManager:
         """
         if not title or not author or not isbn:
             raise ValueError("Title, author, and ISBN are required.")
-        if self.get_book_by_isbn(isbn):
+        if isbn in self.books:
             raise ValueError(f"Book with ISBN {isbn} already exists.")
         book = Book(title, author, isbn)
-        self.books.append(book)
+        self.books[isbn] = book
         self.save_books()
         return book
 
@@ -69,7 +101,7 @@ class BookManager:
         Returns:
             Book: The book with the given ISBN, or None if not found.
         """
-        return next((book for book in self.books if book.isbn == isbn), None)
+        return self.books.get(isbn)
 
     def list_books(self) -> list:
         """
@@ -78,7 +110,7 @@ class BookManager:
         Returns:
             list: A list of all Book objects.
         """
-        return self.books
+        return list(self.books.values())
 
     def update_book(self, isbn: str, title: str = None, author: str = None) -> Book:
         """
@@ -99,9 +131,9 @@ class BookManager:
         if not book:
             raise ValueError(f"Book with ISBN {isbn} not found.")
         if title:
-            book._title = title
+            book.title = title
         if author:
-            book._author = author
+            book.author = author
         self.save_books()
         return book
 
@@ -115,21 +147,22 @@ class BookManager:
         Raises:
             ValueError: If the book with the given ISBN is not found.
         """
-        book = self.get_book_by_isbn(isbn)
-        if not book:
+        if self.books.pop(isbn, None) is None:
             raise ValueError(f"Book with ISBN {isbn} not found.")
-        self.books.remove(book)
         self.save_books()
 
     def search_books(self, keyword: str) -> list:
         """
         Search for books by title or author.
 
+        Matching is case-insensitive against each book's precomputed
+        casefolded title/author, so only the keyword is normalized per call.
+
         Args:
             keyword (str): The search keyword.
 
         Returns:
             list: A list of Book objects that match the search criteria.
         """
-        keyword = keyword.lower()
-        return [book for book in self.books if keyword in book.title.lower() or keyword in book.author.lower()]
\ No newline at end of file
+        keyword = keyword.casefold()
+        return [book for book in self.books.values() if keyword in book._search_blob]
\ No newline at end of file
@@ -1,17 +1,28 @@
+import os
+from collections.abc import Mapping
+from contextlib import contextmanager
 from library.checkout import Checkout
-from library.storage import Storage
+from library.storage import LogStorage, Storage
 from library.managers.book_manager import BookManager
 from library.managers.user_manager import UserManager
+from library.managers.batching import BatchSaveMixin
 import config
 
-class CheckoutManager:
+class CheckoutManager(BatchSaveMixin):
     """
     Manages the checkout process in the library system.
 
     This class handles operations such as checking out books, returning books,
     and keeping track of all checkouts.
+
+    Checkouts and returns are appended to a log in storage rather than
+    rewriting every record; the log is compacted once it grows well beyond
+    the number of active checkouts.
     """
 
+    # Number of stale log records tolerated before the log is compacted
+    COMPACT_MIN_RECORDS = 100
+
     def __init__(self, book_manager: BookManager, user_manager: UserManager):
         """
         Initialize the CheckoutManager.
@@ -20,34 +31,125 @@ class CheckoutManager:
             book_manager (BookManager): The BookManager instance to use.
             user_manager (UserManager): The UserManager instance to use.
         """
-        self.storage = Storage(config.CHECKOUTS_STORAGE_FILE)
+        self.storage = LogStorage(config.CHECKOUTS_STORAGE_FILE)
+        self.legacy_storage = Storage(config.LEGACY_CHECKOUTS_STORAGE_FILE)
         self.book_manager = book_manager
         self.user_manager = user_manager
-        self.checkouts = self._load_checkouts()
+        self._checkouts = None  # Loaded from storage on first access
+        self._pending = []  # Log records not yet written to storage
+        self._log_length = 0  # Number of records currently in the stored log
+        self._rewrite = False  # Whether the next write must rewrite the whole log
+
+    @property
+    def checkouts(self) -> dict:
+        """
+        Get the active checkouts, loading them on first access.
+
+        Returns:
+            dict: The Checkout objects keyed by book ISBN, in checkout order.
+        """
+        if self._checkouts is None:
+            self.checkouts = self._load_checkouts()
+            if self._rewrite:  # Checkouts were migrated from the legacy file
+                self._mark_dirty()
+        return self._checkouts
+
+    @checkouts.setter
+    def checkouts(self, checkouts):
+        """
+        Replace the active checkouts.
+
+        Args:
+            checkouts: An iterable of Checkout objects, or a mapping of them such as
+                the dict returned by the getter; checkouts without a book are dropped.
+        """
+        if isinstance(checkouts, Mapping):
+            checkouts = checkouts.values()
+        self._checkouts = {checkout.book.isbn: checkout for checkout in checkouts if checkout.book}
 
     def _load_checkouts(self) -> list:
         """
         Load checkouts from storage.
 
+        The stored log is replayed in order: a return record ("op": "in")
+        closes the checkout of its book, any other record opens a checkout.
+        Records whose user or book no longer exists are skipped.
+
+        If there is no log yet but the legacy checkouts file exists, its records
+        are loaded instead and the log is rewritten from them on the next write.
+
         Returns:
             list: A list of valid Checkout objects.
         """
         data = self.storage.load_data()
-        checkouts = []
+        if not data and not os.path.exists(self.storage.file_path) \
+                and os.path.exists(self.legacy_storage.file_path):
+            data = self.legacy_storage.load_data()
+            self._rewrite = True
+        self._log_length = len(data)
+        get_user = self.user_manager.get_user_by_id
+        get_book = self.book_manager.get_book_by_isbn
+        from_loaded = Checkout._from_loaded
+        active = {}
         for checkout_data in data:
-            try:
-                checkout = Checkout.from_dict(checkout_data, self.user_manager, self.book_manager)
-                if checkout.user and checkout.book:
-                    checkouts.append(checkout)
-            except AttributeError:
-                # Skip invalid checkouts
-                pass
-        return checkouts
+            isbn = checkout_data["book_isbn"]
+            if checkout_data.get("op") == "in":
+                active.pop(isbn, None)
+                continue
+            user = get_user(checkout_data["user_id"])
+            book = get_book(isbn)
+            if not user or not book:
+                continue
+            active.pop(isbn, None)
+            active[isbn] = from_loaded(user, book, checkout_data["checkout_date"], checkout_data["due_date"])
+        return list(active.values())
 
     def save_checkouts(self):
-        """Save the current list of checkouts to storage."""
-        valid_checkouts = [checkout for checkout in self.checkouts if checkout.user and checkout.book]
+        """Save the current list of checkouts to storage, deferred while a batch is open."""
+        self._rewrite = True
+        self._mark_dirty()
+
+    def _log(self, record: dict):
+        """
+        Queue a record for the checkout log, deferred while a batch is open.
+
+        Args:
+            record (dict): The record to append to the log.
+        """
+        self._pending.append(record)
+        self._mark_dirty()
+
+    def _write(self):
+        """Append pending records to the log, compacting it if it has grown too long."""
+        log_length = self._log_length + len(self._pending)
+        if self._rewrite or log_length > 2 * len(self.checkouts) + self.COMPACT_MIN_RECORDS:
+            self.compact()
+        elif self._pending:
+            self.storage.append_data(self._pending)
+            self._log_length = log_length
+            self._pending = []
+
+    def compact(self):
+        """Rewrite the stored log so that it only holds the active checkouts."""
+        valid_checkouts = [checkout for checkout in self.checkouts.values() if checkout.user]
         self.storage.save_data([checkout.to_dict() for checkout in valid_checkouts])
+        self._log_length = len(valid_checkouts)
+        self._pending = []
+        self._rewrite = False
+
+    @contextmanager
+    def batch(self):
+        """
+        Defer checkout and book writes until the end of the block.
+
+        Checking out or returning a book also changes the book's availability,
+        so the book manager is batched together with the checkouts.
+
+        Yields:
+            CheckoutManager: The checkout manager itself.
+        """
+        with self.book_manager.batch(), super().batch():
+            yield self
 
     def checkout_book(self, user_id: str, isbn: str) -> Checkout:
         """
@@ -77,8 +179,8 @@ class CheckoutManager:
         
         checkout = Checkout(user, book)
         book.available = False
-        self.checkouts.append(checkout)
-        self.save_checkouts()
+        self.checkouts[isbn] = checkout
+        self._log({"op": "out", **checkout.to_dict()})
         self.book_manager.save_books()
         return checkout
 
@@ -92,16 +194,13 @@ class CheckoutManager:
         Raises:
             ValueError: If the book is not found or has already been returned.
         """
-        checkout = next((c for c in self.checkouts if c.book and c.book.isbn == isbn and not c.book.available), None)
-        if not checkout:
+        checkout = self.checkouts.get(isbn)
+        if not checkout or checkout.book.available:
             raise ValueError("Book not found or already returned")
         
-        if not checkout.book:
-            raise ValueError("Invalid checkout: book information is missing")
-        
         checkout.book.available = True
-        self.checkouts.remove(checkout)
-        self.save_checkouts()
+        del self.checkouts[isbn]
+        self._log({"op": "in", "book_isbn": isbn})
         self.book_manager.save_books()
 
     def get_checked_out_books(self) -> list:
@@ -111,4 +210,4 @@ class CheckoutManager:
         Returns:
             list: A list of Book objects that are currently checked out.
         """
-        return [checkout.book for checkout in self.checkouts if checkout.book and not checkout.book.available]
\ No newline at end of file
+        return [checkout.book for checkout in self.checkouts.values() if not checkout.book.available]
\ No newline at end of file
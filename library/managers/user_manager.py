@@ -1,8 +1,10 @@
+from collections.abc import Mapping
 from library.user import User
 from library.storage import Storage
+from library.managers.batching import BatchSaveMixin
 import config
 
-class UserManager:
+class UserManager(BatchSaveMixin):
     """
     Manages the users in the library system.
 
@@ -13,33 +15,93 @@ class UserManager:
     def __init__(self):
         """Initialize the UserManager."""
         self.storage = Storage(config.USERS_STORAGE_FILE)
-        self.users = self._load_users()
-        self.next_id = self._get_next_id()
+        # Users and the next ID are loaded from storage on first access
+        self._users = None
+        self._next_id = None
+        self._stored_next_id = None  # Next ID recorded in the users file, if any
+
+    @property
+    def users(self) -> dict:
+        """
+        Get the registered users, loading them on first access.
+
+        Returns:
+            dict: The User objects keyed by user ID, in the order they were added.
+        """
+        if self._users is None:
+            self.users = self._load_users()
+        return self._users
+
+    @users.setter
+    def users(self, users):
+        """
+        Replace the registered users.
+
+        Args:
+            users: An iterable of User objects, or a mapping of them such as
+                the dict returned by the getter.
+        """
+        if isinstance(users, Mapping):
+            users = users.values()
+        self._users = {user.user_id: user for user in users}
+
+    @property
+    def next_id(self) -> int:
+        """Get the ID that will be given to the next new user."""
+        if self._next_id is None:
+            self._next_id = self._get_next_id()
+        return self._next_id
+
+    @next_id.setter
+    def next_id(self, value: int):
+        """Set the ID that will be given to the next new user."""
+        self._next_id = value
 
     def _load_users(self) -> list:
         """
         Load users from storage.
 
+        The users file holds {"next_id": ..., "users": [...]}. Files written by
+        older versions hold just the list of users; they are converted the next
+        time the users are saved.
+
         Returns:
             list: A list of User objects.
         """
         data = self.storage.load_data()
-        return [User.from_dict(user_data) for user_data in data]
+        if isinstance(data, dict):
+            self._stored_next_id = data["next_id"]
+            data = data["users"]
+        from_dict = User.from_dict
+        return [from_dict(user_data) for user_data in data]
 
     def _get_next_id(self) -> int:
         """
         Determine the next available user ID.
 
+        The ID stored in the users file is used when there is one; otherwise
+        it is derived from the highest existing user ID.
+
         Returns:
             int: The next available user ID.
         """
-        if not self.users:
+        users = self.users  # Loading the users also reads the stored next ID
+        if self._stored_next_id is not None:
+            return self._stored_next_id
+        if not users:
             return 1
-        return max(int(user.user_id) for user in self.users) + 1
+        return max(int(user_id) for user_id in users) + 1
 
     def save_users(self):
-        """Save the current list of users to storage."""
-        self.storage.save_data([user.to_dict() for user in self.users])
+        """Save the current list of users to storage, deferred while a batch is open."""
+        self._mark_dirty()
+
+    def _write(self):
+        """Write the current list of users to storage."""
+        self.storage.save_data({
+            "next_id": self.next_id,
+            "users": [user.to_dict() for user in self.users.values()]
+        })
 
     def add_user(self, name: str) -> User:
         """
@@ -58,7 +120,7 @@ class UserManager:
             raise ValueError("User name is required.")
         user_id = str(self.next_id)
         user = User(name, user_id)
-        self.users.append(user)
+        self.users[user_id] = user
         self.next_id += 1
         self.save_users()
         return user
@@ -73,7 +135,7 @@ class UserManager:
         Returns:
             User: The User object with the given ID, or None if not found.
         """
-        return next((user for user in self.users if user.user_id == user_id), None)
+        return self.users.get(user_id)
 
     def list_users(self) -> list:
         """
@@ -82,7 +144,7 @@ class UserManager:
         Returns:
             list: A list of all User objects.
         """
-        return self.users
+        return list(self.users.values())
 
     def update_user(self, user_id: str, name: str) -> User:
         """
@@ -115,10 +177,8 @@ class UserManager:
         Raises:
             ValueError: If the user with the given ID is not found.
         """
-        user = self.get_user_by_id(user_id)
-        if not user:
+        if self.users.pop(user_id, None) is None:
             raise ValueError(f"User with ID {user_id} not found.")
-        self.users.remove(user)
         self.save_users()
 
     def search_users(self, name: str) -> list:
@@ -132,4 +192,4 @@ class UserManager:
             list: A list of User objects that match the search criteria.
         """
         name = name.lower()
-        return [user for user in self.users if name in user.name.lower()]
\ No newline at end of file
+        return [user for user in self.users.values() if name in user._name_lower]
\ No newline at end of file
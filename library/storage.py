@@ -1,54 +1,163 @@
-import json
-import os
-
-class Storage:
-    """
-    Handles data storage and retrieval for the library system.
-
-    This class provides methods to save and load data either to/from a file
-    or in-memory, depending on the configuration.
-    """
-
-    def __init__(self, file_path: str):
-        """
-        Initialize a Storage instance.
-
-        Args:
-            file_path (str): The path to the file where data will be stored.
-                             If set to ':memory:', data will be stored in memory.
-        """
-        self.file_path = file_path
-        self.in_memory_data = []
-
-    def save_data(self, data: list):
-        """
-        Save data either to a file or in memory.
-
-        Args:
-            data (list): The data to be saved.
-        """
-        if self.file_path == ':memory:':
-            self.in_memory_data = data
-        else:
-            with open(self.file_path, 'w') as f:
-                json.dump(data, f, indent=2)
-
-    def load_data(self) -> list:
-        """
-        Load data either from a file or from memory.
-
-        Returns:
-            list: The loaded data.
-        """
-        if self.file_path == ':memory:':
-            return self.in_memory_data
-        
-        # Check if file exists and is not empty
-        if not os.path.exists(self.file_path) or os.path.getsize(self.file_path) == 0:
-            return []
-        
-        with open(self.file_path, 'r') as f:
-            content = f.read().strip()
-            if not content:
-                return []
-        return json.loads(content)
\ No newline at end of file
+import json
+import os
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+def _dumps(record) -> bytes:
+    """Encode a single record as compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(record)
+    return json.dumps(record, separators=(',', ':')).encode()
+
+def _loads(content: bytes):
+    """Decode JSON from bytes."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+class Storage:
+    """
+    Handles data storage and retrieval for the library system.
+
+    This class provides methods to save and load data either to/from a file
+    or in-memory, depending on the configuration.
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Initialize a Storage instance.
+
+        Args:
+            file_path (str): The path to the file where data will be stored.
+                             If set to ':memory:', data will be stored in memory.
+        """
+        self.file_path = file_path
+        self.in_memory_data = []
+        self._last_payload = None  # Bytes last written to or read from the file
+
+    def save_data(self, data):
+        """
+        Save data either to a file or in memory.
+
+        Args:
+            data (list or dict): The data to be saved.
+        """
+        if self.file_path == ':memory:':
+            self.in_memory_data = data
+            return
+
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, indent=2).encode()
+        # Skip the write entirely if the file already holds exactly this data
+        if payload == self._last_payload and os.path.exists(self.file_path):
+            return
+
+        # Write to a temporary file and swap it in, so a crash mid-write
+        # never leaves a truncated data file behind
+        tmp_path = self.file_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, self.file_path)
+        self._last_payload = payload
+
+    def load_data(self):
+        """
+        Load data either from a file or from memory.
+
+        Returns:
+            list or dict: The loaded data, or an empty list if nothing is stored.
+        """
+        if self.file_path == ':memory:':
+            return self.in_memory_data
+        
+        # Check if file exists and is not empty
+        if not os.path.exists(self.file_path) or os.path.getsize(self.file_path) == 0:
+            return []
+        
+        with open(self.file_path, 'rb') as f:
+            content = f.read()
+        # A whitespace-only file is treated the same as an empty one
+        if content.isspace():
+            return []
+        self._last_payload = content
+        return _loads(content)
+
+class LogStorage(Storage):
+    """
+    Stores records as an append-only log of JSON lines.
+
+    New records are appended to the end of the file instead of rewriting it,
+    which keeps the cost of each write independent of the amount of stored data.
+    save_data still rewrites the whole file and is used to compact the log.
+    """
+
+    def save_data(self, data: list):
+        """
+        Replace all records, either in a file or in memory.
+
+        Args:
+            data (list): The records to be saved.
+        """
+        if self.file_path == ':memory:':
+            self.in_memory_data = data
+            return
+
+        tmp_path = self.file_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.writelines(_dumps(record) + b'\n' for record in data)
+        os.replace(tmp_path, self.file_path)
+
+    def append_data(self, records: list):
+        """
+        Append records to the end of the log.
+
+        Args:
+            records (list): The records to be appended.
+        """
+        if not records:
+            return
+        if self.file_path == ':memory:':
+            self.in_memory_data.extend(records)
+            return
+
+        with open(self.file_path, 'ab') as f:
+            f.writelines(_dumps(record) + b'\n' for record in records)
+
+    def load_data(self) -> list:
+        """
+        Load all records, either from a file or from memory.
+
+        Appends are not atomic, so a crash can leave the last line half written.
+        Such a line is dropped and cut from the file, so that the next append
+        starts on a fresh line; a complete last line that is only missing its
+        newline is kept and terminated.
+
+        Returns:
+            list: The loaded records, in the order they were written.
+        """
+        if self.file_path == ':memory:':
+            return self.in_memory_data
+
+        if not os.path.exists(self.file_path):
+            return []
+
+        with open(self.file_path, 'rb') as f:
+            content = f.read()
+        lines = content.split(b'\n')
+        tail = lines.pop()  # Text after the last newline, normally empty
+        records = [_loads(line) for line in lines if line and not line.isspace()]
+        if tail and not tail.isspace():
+            try:
+                records.append(_loads(tail))
+            except ValueError:
+                with open(self.file_path, 'r+b') as f:
+                    f.truncate(len(content) - len(tail))
+            else:
+                with open(self.file_path, 'ab') as f:
+                    f.write(b'\n')
+        return records
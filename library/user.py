@@ -5,6 +5,8 @@ class User:
     This class manages user information, including name and user ID.
     """
 
+    __slots__ = ('_name', 'user_id', '_name_lower')
+
     def __init__(self, name: str, user_id: str):
         """
         Initialize a User.
@@ -16,6 +18,17 @@ class User:
         self.name = name
         self.user_id = user_id
 
+    @property
+    def name(self) -> str:
+        """Get the name of the user."""
+        return self._name
+
+    @name.setter
+    def name(self, value: str):
+        """Set the name of the user, keeping the lowercased copy used for searches in sync."""
+        self._name = value
+        self._name_lower = value.lower()
+
     def __str__(self) -> str:
         """
         Return a string representation of the user.
@@ -1,118 +1,174 @@
 from library.managers.book_manager import BookManager
 from library.managers.user_manager import UserManager
 from library.managers.checkout_manager import CheckoutManager
-from typing import Optional
-import re
-from colorama import Fore, Style, init
-import os
+import string
 import sys
 
-# Initialize colorama
-init(autoreset=True)
+if sys.stdout is not None and sys.stdout.isatty():
+    # Initialize colorama only when writing to a terminal; it wraps stdout
+    from colorama import Fore, Style, init
+    init(autoreset=True)
+    # ANSI cursor-home, clear-screen and clear-scrollback sequence, as
+    # emitted by `clear`. On Windows colorama translates it for the console.
+    _CLEAR_SCREEN = "\x1b[H\x1b[2J\x1b[3J"
+else:
+    class _NoColor:
+        """Stand-in for colorama's Fore and Style that yields empty codes."""
+
+        def __getattr__(self, name: str) -> str:
+            return ''
+
+    # Output is redirected, so colors and screen clearing are left out
+    Fore = Style = _NoColor()
+    _CLEAR_SCREEN = ""
+
+# Characters allowed in names, besides other Unicode whitespace
+_NAME_CHARS = frozenset(string.ascii_letters + string.whitespace)
+
+# Menus are built once and written with a single call on every redraw.
+# Only the title is colored; RESET_ALL keeps the options in the default color.
+_MAIN_MENU = (
+    Fore.CYAN + "\n📚 Library Management System" + Style.RESET_ALL + "\n"
+    "1. 📖 Manage Books\n"
+    "2. 👥 Manage Users\n"
+    "3. 🚪 Exit\n"
+)
+_BOOKS_MENU = (
+    Fore.CYAN + "\n📖 Manage Books" + Style.RESET_ALL + "\n"
+    "1. 📕 Add Book\n"
+    "2. 🔄 Update Book\n"
+    "3. 🗑️ Delete Book\n"
+    "4. 📤 Checkout Book\n"
+    "5. 📥 Return Book\n"
+    "6. 📋 List Books\n"
+    "7. 🔍 Search Book\n"
+    "8. 🔙 Return to Main Menu\n"
+    "9. 🚪 Exit\n"
+)
+_USERS_MENU = (
+    Fore.CYAN + "\n👥 Manage Users" + Style.RESET_ALL + "\n"
+    "1. ➕ Add User\n"
+    "2. 🔄 Update User\n"
+    "3. 🗑️ Delete User\n"
+    "4. 📋 List Users\n"
+    "5. 🔍 Search User\n"
+    "6. 🔙 Return to Main Menu\n"
+    "7. 🚪 Exit\n"
+)
+_SEARCH_BOOK_MENU = (
+    Fore.CYAN + "🔍 Search Book" + Style.RESET_ALL + "\n"
+    "1. 🔢 Search by ISBN\n"
+    "2. 📚 Search by Title\n"
+)
+_SEARCH_USER_MENU = (
+    Fore.CYAN + "🔍 Search User" + Style.RESET_ALL + "\n"
+    "1. 🆔 Search by ID\n"
+    "2. 👤 Search by Name\n"
+)
+
+# Error messages shown for invalid input
+_ERR_INVALID = Fore.RED + "Invalid choice, please try again."
+_ERR_ISBN = Fore.RED + "Error: ISBN must be a 10-digit number."
+_ERR_NAME = Fore.RED + "Error: Name must contain only letters and spaces."
+_ERR_AUTHOR = Fore.RED + "Error: Author Name must contain only letters and spaces."
+
+# Availability labels shown by list_books
+_STATUS_AVAILABLE = "Available ✅"
+_STATUS_OUT = "Checked Out ❌"
 
 def clear_screen():
-    os.system('cls' if os.name == 'nt' else 'clear')
+    sys.stdout.write(_CLEAR_SCREEN)
 
 class LibrarySystem:
+    __slots__ = (
+        'book_manager',
+        'user_manager',
+        'checkout_manager',
+        '_book_actions',
+        '_user_actions',
+    )
+
     def __init__(self):
         self.book_manager = BookManager()
         self.user_manager = UserManager()
         self.checkout_manager = CheckoutManager(self.book_manager, self.user_manager)
+        # Menu choices mapped to their actions, built once per instance
+        self._book_actions = {
+            '1': self.add_book,
+            '2': self.update_book,
+            '3': self.delete_book,
+            '4': self.checkout_book,
+            '5': self.return_book,
+            '6': self.list_books,
+            '7': self.search_book,
+        }
+        self._user_actions = {
+            '1': self.add_user,
+            '2': self.update_user,
+            '3': self.delete_user,
+            '4': self.list_users,
+            '5': self.search_user,
+        }
 
     def run(self) -> None:
         while True:
             clear_screen()
             choice = self.main_menu()
+            exit_requested = False
             if choice == '1':
-                self.manage_books()
+                exit_requested = self.manage_books()
             elif choice == '2':
-                self.manage_users()
+                exit_requested = self.manage_users()
             elif choice == '3':
+                exit_requested = True
+            else:
+                print(_ERR_INVALID)
+                input("Press Enter to continue...")
+
+            if exit_requested:
                 clear_screen()
                 print(Fore.YELLOW + "Exiting. Goodbye! 👋")
                 break
-            else:
-                print(Fore.RED + "Invalid choice, please try again.")
-                input("Press Enter to continue...")
 
     def main_menu(self) -> str:
-        print(Fore.CYAN + "\n📚 Library Management System")
-        print("1. 📖 Manage Books")
-        print("2. 👥 Manage Users")
-        print("3. 🚪 Exit")
+        sys.stdout.write(_MAIN_MENU)
         return input(Fore.WHITE + "Enter choice: ")
 
-    def manage_books(self) -> None:
+    # The submenus return True when the user chooses to exit the application,
+    # letting run() finish normally instead of raising SystemExit
+    def manage_books(self) -> bool:
         while True:
             clear_screen()
-            print(Fore.CYAN + "\n📖 Manage Books")
-            print("1. 📕 Add Book")
-            print("2. 🔄 Update Book")
-            print("3. 🗑️ Delete Book")
-            print("4. 📤 Checkout Book")
-            print("5. 📥 Return Book")
-            print("6. 📋 List Books")
-            print("7. 🔍 Search Book")
-            print("8. 🔙 Return to Main Menu")
-            print("9. 🚪 Exit")
+            sys.stdout.write(_BOOKS_MENU)
             choice = input(Fore.WHITE + "Enter choice: ")
 
-            if choice == '1':
-                self.add_book()
-            elif choice == '2':
-                self.update_book()
-            elif choice == '3':
-                self.delete_book()
-            elif choice == '4':
-                self.checkout_book()
-            elif choice == '5':
-                self.return_book()
-            elif choice == '6':
-                self.list_books()
-            elif choice == '7':
-                self.search_book()
+            action = self._book_actions.get(choice)
+            if action:
+                action()
             elif choice == '8':
-                break
+                return False
             elif choice == '9':
-                clear_screen()
-                print(Fore.YELLOW + "Exiting. Goodbye! 👋")
-                sys.exit()
+                return True
             else:
-                print(Fore.RED + "Invalid choice, please try again.")
+                print(_ERR_INVALID)
             
             input("Press Enter to continue...")
 
-    def manage_users(self) -> None:
+    def manage_users(self) -> bool:
         while True:
             clear_screen()
-            print(Fore.CYAN + "\n👥 Manage Users")
-            print("1. ➕ Add User")
-            print("2. 🔄 Update User")
-            print("3. 🗑️ Delete User")
-            print("4. 📋 List Users")
-            print("5. 🔍 Search User")
-            print("6. 🔙 Return to Main Menu")
-            print("7. 🚪 Exit")
+            sys.stdout.write(_USERS_MENU)
             choice = input(Fore.WHITE + "Enter choice: ")
 
-            if choice == '1':
-                self.add_user()
-            elif choice == '2':
-                self.update_user()
-            elif choice == '3':
-                self.delete_user()
-            elif choice == '4':
-                self.list_users()
-            elif choice == '5':
-                self.search_user()
+            action = self._user_actions.get(choice)
+            if action:
+                action()
             elif choice == '6':
-                break
+                return False
             elif choice == '7':
-                clear_screen()
-                print(Fore.YELLOW + "Exiting. Goodbye! 👋")
-                sys.exit()
+                return True
             else:
-                print(Fore.RED + "Invalid choice, please try again.")
+                print(_ERR_INVALID)
             
             input("Press Enter to continue...")
 
@@ -124,11 +180,11 @@ class LibrarySystem:
         isbn = input("Enter ISBN (10 digits): ")
         
         if not self.validate_isbn(isbn):
-            print(Fore.RED + "Error: ISBN must be a 10-digit number.")
+            print(_ERR_ISBN)
             return
         
         if not self.validate_name(author):
-            print(Fore.RED + "Error: Author Name must contain only letters and spaces.")
+            print(_ERR_AUTHOR)
             return
         
         try:
@@ -138,21 +194,22 @@ class LibrarySystem:
             print(Fore.RED + f"Error: {e}")
 
     def validate_isbn(self, isbn: str) -> bool:
-        return bool(re.match(r'^\d{10}$', isbn))
+        # Same check as the regex \A\d{10}\Z without running the regex engine
+        return len(isbn) == 10 and isbn.isdecimal()
 
     def update_book(self) -> None:
         clear_screen()
         print(Fore.CYAN + "🔄 Update Book")
         isbn = input("Enter ISBN of the book to update: ")
         if not self.validate_isbn(isbn):
-            print(Fore.RED + "Error: ISBN must be a 10-digit number.")
+            print(_ERR_ISBN)
             return
 
         title = input("Enter new title (press enter to keep current): ")
         author = input("Enter new author (press enter to keep current): ")
         
         if author and not self.validate_name(author):
-            print(Fore.RED + "Error: Author Name must contain only letters and spaces.")
+            print(_ERR_AUTHOR)
             return
 
         try:
@@ -166,7 +223,7 @@ class LibrarySystem:
         print(Fore.CYAN + "🗑️ Delete Book")
         isbn = input("Enter ISBN of the book to delete: ")
         if not self.validate_isbn(isbn):
-            print(Fore.RED + "Error: ISBN must be a 10-digit number.")
+            print(_ERR_ISBN)
             return
 
         try:
@@ -182,45 +239,52 @@ class LibrarySystem:
         if not books:
             print(Fore.YELLOW + "No books in the library. 📚")
         else:
-            for book in books:
-                status = "Available ✅" if book.available else "Checked Out ❌"
-                print(f"{book} - Status: {status}")
+            print("\n".join(
+                f"{book} - Status: {_STATUS_AVAILABLE if book.available else _STATUS_OUT}"
+                for book in books
+            ))
     
     def search_book(self) -> None:
         clear_screen()
-        print(Fore.CYAN + "🔍 Search Book")
-        print("1. 🔢 Search by ISBN")
-        print("2. 📚 Search by Title")
+        sys.stdout.write(_SEARCH_BOOK_MENU)
         choice = input(Fore.WHITE + "Enter choice: ")
 
         if choice == '1':
-            isbn = input("Enter ISBN: ")
-            if not self.validate_isbn(isbn):
-                print(Fore.RED + "Error: ISBN must be a 10-digit number.")
-                return
-            book = self.book_manager.get_book_by_isbn(isbn)
-            if book:
-                print(Fore.GREEN + f"Book found: {book}")
-            else:
-                print(Fore.YELLOW + "No book found with this ISBN.")
+            self._search_book_by_isbn()
         elif choice == '2':
-            title = input("Enter title or part of title: ").lower()
-            books = self.book_manager.search_books(title)
-            if books:
-                print(Fore.GREEN + "Books found:")
-                for book in books:
-                    print(book)
-            else:
-                print(Fore.YELLOW + "No books found with this title.")
+            self._search_book_by_title()
+        else:
+            print(_ERR_INVALID)
+
+    def _search_book_by_isbn(self) -> None:
+        isbn = input("Enter ISBN: ")
+        if not self.validate_isbn(isbn):
+            print(_ERR_ISBN)
+            return
+        # BookManager keeps books in a dict keyed by ISBN, so this is a single
+        # O(1) lookup; the validated input is already the exact key.
+        book = self.book_manager.get_book_by_isbn(isbn)
+        if book:
+            print(Fore.GREEN + f"Book found: {book}")
         else:
-            print(Fore.RED + "Invalid choice, please try again.")
+            print(Fore.YELLOW + "No book found with this ISBN.")
+
+    def _search_book_by_title(self) -> None:
+        title = input("Enter title or part of title: ").strip().casefold()
+        books = self.book_manager.search_books(title)
+        if books:
+            print(Fore.GREEN + "Books found:")
+            for book in books:
+                print(book)
+        else:
+            print(Fore.YELLOW + "No books found with this title.")
 
     def add_user(self) -> None:
         clear_screen()
         print(Fore.CYAN + "➕ Add User")
         name = input("Enter user name: ")
         if not self.validate_name(name):
-            print(Fore.RED + "Error: Name must contain only letters and spaces.")
+            print(_ERR_NAME)
             return
 
         try:
@@ -230,7 +294,8 @@ class LibrarySystem:
             print(Fore.RED + f"Error: {e}")
 
     def validate_name(self, name: str) -> bool:
-        return bool(re.match(r'^[A-Za-z\s]+$', name))
+        # Letters and whitespace only, matching the regex \A[A-Za-z\s]+\Z
+        return bool(name) and all(c.isspace() for c in set(name) - _NAME_CHARS)
 
     def update_user(self) -> None:
         clear_screen()
@@ -238,7 +303,7 @@ class LibrarySystem:
         user_id = input("Enter user ID to update: ")
         name = input("Enter new name: ")
         if not self.validate_name(name):
-            print(Fore.RED + "Error: Name must contain only letters and spaces.")
+            print(_ERR_NAME)
             return
 
         try:
@@ -264,37 +329,42 @@ class LibrarySystem:
         if not users:
             print(Fore.YELLOW + "No users registered. 👥")
         else:
-            for user in users:
-                print(user)
+            print("\n".join(map(str, users)))
     
     def search_user(self) -> None:
         clear_screen()
-        print(Fore.CYAN + "🔍 Search User")
-        print("1. 🆔 Search by ID")
-        print("2. 👤 Search by Name")
+        sys.stdout.write(_SEARCH_USER_MENU)
         choice = input(Fore.WHITE + "Enter choice: ")
 
         if choice == '1':
-            user_id = input("Enter user ID: ")
-            user = self.user_manager.get_user_by_id(user_id)
-            if user:
-                print(Fore.GREEN + f"User found: {user}")
-            else:
-                print(Fore.YELLOW + "No user found with this ID.")
+            self._search_user_by_id()
         elif choice == '2':
-            name = input("Enter user name or part of name: ")
-            if not self.validate_name(name):
-                print(Fore.RED + "Error: Name must contain only letters and spaces.")
-                return
-            users = self.user_manager.search_users(name)
-            if users:
-                print(Fore.GREEN + "Users found:")
-                for user in users:
-                    print(user)
-            else:
-                print(Fore.YELLOW + "No users found with this name.")
+            self._search_user_by_name()
+        else:
+            print(_ERR_INVALID)
+
+    def _search_user_by_id(self) -> None:
+        user_id = input("Enter user ID: ")
+        # UserManager keeps users in a dict keyed by user ID; the raw input is
+        # passed straight through as the key.
+        user = self.user_manager.get_user_by_id(user_id)
+        if user:
+            print(Fore.GREEN + f"User found: {user}")
+        else:
+            print(Fore.YELLOW + "No user found with this ID.")
+
+    def _search_user_by_name(self) -> None:
+        name = input("Enter user name or part of name: ")
+        if not self.validate_name(name):
+            print(_ERR_NAME)
+            return
+        users = self.user_manager.search_users(name)
+        if users:
+            print(Fore.GREEN + "Users found:")
+            for user in users:
+                print(user)
         else:
-            print(Fore.RED + "Invalid choice, please try again.")
+            print(Fore.YELLOW + "No users found with this name.")
 
     def checkout_book(self) -> None:
         clear_screen()
@@ -302,7 +372,7 @@ class LibrarySystem:
         user_id = input("Enter user ID: ")
         isbn = input("Enter ISBN of the book to checkout: ")
         if not self.validate_isbn(isbn):
-            print(Fore.RED + "Error: ISBN must be a 10-digit number.")
+            print(_ERR_ISBN)
             return
 
         try:
@@ -316,7 +386,7 @@ class LibrarySystem:
         print(Fore.CYAN + "📥 Return Book")
         isbn = input("Enter ISBN of the book to return: ")
         if not self.validate_isbn(isbn):
-            print(Fore.RED + "Error: ISBN must be a 10-digit number.")
+            print(_ERR_ISBN)
             return
 
         try:
@@ -1,22 +1,27 @@
-import unittest
+import importlib.util
+import sys
 
-# This script is used to run all the unit tests in the project automatically
+import pytest
 
-# Create a TestLoader object
-# TestLoader is responsible for loading tests according to various criteria
-test_loader = unittest.TestLoader()
+# This script is used to run all the unit tests in the project automatically
 
-# Discover all tests in the 'tests' directory
-# This method walks through all files in the specified directory (and subdirectories)
-# and loads any tests it finds (files that match the pattern test*.py)
-test_suite = test_loader.discover('tests')
+# The test modules to run
+# Listing them explicitly skips directory discovery; add new test modules here
+TEST_MODULES = [
+    'tests/test_book_manager.py',
+    'tests/test_user_manager.py',
+    'tests/test_checkout_manager.py',
+    'tests/test_library_system.py',
+    'tests/test_storage.py',
+]
 
-# Create a TextTestRunner object
-# This runner will execute the tests and output the results to the console
-runner = unittest.TextTestRunner()
+args = ['-q', *TEST_MODULES]
 
-# Run the discovered tests
-# This will execute all the tests found in the 'tests' directory
-# and print the results (passes, failures, errors) to the console
-runner.run(test_suite)
+# Spread the tests across all CPU cores when pytest-xdist is installed,
+# otherwise run them sequentially in this process
+if importlib.util.find_spec('xdist') is not None:
+    args[:0] = ['-n', 'auto']
 
+# Run the tests and exit with pytest's status code so failures are visible
+# to the calling shell or CI job
+sys.exit(pytest.main(args))
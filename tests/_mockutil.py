@@ -0,0 +1,36 @@
+"""
+Helpers for building spec'd mocks in tests.
+"""
+import functools
+from unittest.mock import MagicMock
+
+
+@functools.lru_cache(maxsize=None)
+def _spec_template(spec) -> MagicMock:
+    """
+    Build the MagicMock for a spec once and reuse it afterwards.
+
+    Args:
+        spec (type | tuple[str, ...]): A class, or a tuple of attribute names, to use as the mock's spec.
+
+    Returns:
+        MagicMock: The cached mock for this spec.
+    """
+    return MagicMock(spec=spec)
+
+
+def fresh_mock(spec) -> MagicMock:
+    """
+    Return the cached mock for a spec, reset for a new test.
+
+    The mock is shared, so only one can be live per spec at a time.
+
+    Args:
+        spec (type | tuple[str, ...]): A class, or a tuple of attribute names, to use as the mock's spec.
+
+    Returns:
+        MagicMock: The mock, with calls, return values and side effects cleared.
+    """
+    mock = _spec_template(spec)
+    mock.reset_mock(return_value=True, side_effect=True)
+    return mock
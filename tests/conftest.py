@@ -0,0 +1,100 @@
+"""
+Shared pytest fixtures for the test suite.
+
+The manager fixtures hand out the cached spec'd mock for their manager, reset
+for the test that uses it (see tests/_mockutil.py).
+"""
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import config
+from tests._mockutil import fresh_mock
+
+# Public methods of each manager, used as mock specs so that building a mock
+# does not have to introspect the manager class
+BOOK_MANAGER_METHODS = (
+    'add_book', 'get_book_by_isbn', 'list_books', 'update_book', 'delete_book',
+    'search_books', 'save_books', 'batch', 'flush',
+)
+USER_MANAGER_METHODS = (
+    'add_user', 'get_user_by_id', 'list_users', 'update_user', 'delete_user',
+    'search_users', 'save_users', 'batch', 'flush',
+)
+CHECKOUT_MANAGER_METHODS = (
+    'checkout_book', 'return_book', 'get_checked_out_books', 'save_checkouts',
+    'compact', 'batch', 'flush',
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _isolate_data_files(tmp_path_factory):
+    """
+    Keep the test session away from the real data files.
+
+    The storage paths in config point at an empty temporary directory, so any
+    manager left on its default storage finds no data and writes nowhere that
+    matters. Storage itself is left unpatched, so storage tests exercise the
+    real code. Tests that care about what is stored give their manager a mock
+    or a file under tmp_path instead.
+    """
+    data_dir = tmp_path_factory.mktemp("data")
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(config, 'BOOKS_STORAGE_FILE', str(data_dir / 'books_data.json'))
+        monkeypatch.setattr(config, 'USERS_STORAGE_FILE', str(data_dir / 'users_data.json'))
+        monkeypatch.setattr(config, 'CHECKOUTS_STORAGE_FILE', str(data_dir / 'checkouts_data.jsonl'))
+        monkeypatch.setattr(config, 'LEGACY_CHECKOUTS_STORAGE_FILE', str(data_dir / 'checkouts_data.json'))
+        yield
+
+
+@pytest.fixture
+def book_manager_mock():
+    return fresh_mock(BOOK_MANAGER_METHODS)
+
+
+@pytest.fixture
+def user_manager_mock():
+    return fresh_mock(USER_MANAGER_METHODS)
+
+
+@pytest.fixture
+def checkout_manager_mock():
+    return fresh_mock(CHECKOUT_MANAGER_METHODS)
+
+
+@pytest.fixture
+def inputs(monkeypatch):
+    """
+    Feed a sequence of answers to input() for the current test.
+
+    Returns:
+        Callable[[Iterable[str]], None]: Call it with the answers, in the order
+        they will be prompted for.
+    """
+    def _set(seq):
+        answers = iter(seq)
+        monkeypatch.setattr('builtins.input', lambda *args, **kwargs: next(answers))
+    return _set
+
+
+@pytest.fixture
+def user_from_dict_mock():
+    """
+    Patch User.from_dict for the current test.
+
+    Returns:
+        MagicMock: The mock that replaces User.from_dict.
+    """
+    with patch('library.user.User.from_dict') as mock_from_dict:
+        yield mock_from_dict
+
+
+@pytest.fixture
+def mock_storage():
+    """
+    Provide a mock storage object for the manager under test.
+
+    Returns:
+        MagicMock: A fresh mock standing in for Storage or LogStorage.
+    """
+    return MagicMock()
@@ -1,130 +1,229 @@
-import unittest
-from unittest.mock import patch, MagicMock
+"""
+Unit tests for the BookManager class.
+
+These tests verify the functionality of the BookManager class,
+ensuring that books can be added, retrieved, updated, deleted, and searched correctly.
+"""
+import pytest
 from library.managers.book_manager import BookManager
 from library.book import Book
 
-class TestBookManager(unittest.TestCase):
-    """
-    Unit test case for the BookManager class.
-
-    This test case verifies the functionality of the BookManager class,
-    ensuring that books can be added, retrieved, updated, deleted, and searched correctly.
-    """
-
-    def setUp(self):
-        """
-        Set up the test environment.
-
-        This method initializes a mock storage object and a BookManager instance.
-        It also clears the books list before each test.
-        """
-        self.mock_storage = MagicMock()
-        self.book_manager = BookManager(storage=self.mock_storage)
-        self.book_manager.books = []  # Clear books for each test
-
-    def test_add_book(self):
-        """
-        Test adding a book to the BookManager.
-
-        This test verifies that a book is correctly added to the BookManager
-        and that its attributes are set correctly.
-        """
-        book = self.book_manager.add_book("Test Book", "Test Author", "1234567890")
-        self.assertEqual(len(self.book_manager.books), 1)
-        self.assertEqual(book.title, "Test Book")
-        self.assertEqual(book.author, "Test Author")
-        self.assertEqual(book.isbn, "1234567890")
-
-    def test_add_book_duplicate_isbn(self):
-        """
-        Test adding a book with a duplicate ISBN.
-
-        This test verifies that adding a book with an ISBN that already exists
-        in the BookManager raises a ValueError.
-        """
-        self.book_manager.add_book("Test Book", "Test Author", "1234567890")
-        with self.assertRaises(ValueError):
-            self.book_manager.add_book("Another Book", "Another Author", "1234567890")
-
-    def test_get_book_by_isbn(self):
-        """
-        Test retrieving a book by its ISBN.
-
-        This test verifies that a book can be retrieved from the BookManager
-        using its ISBN and that the correct book is returned.
-        """
-        self.book_manager.add_book("Test Book", "Test Author", "1234567890")
-        book = self.book_manager.get_book_by_isbn("1234567890")
-        self.assertIsNotNone(book)
-        self.assertEqual(book.title, "Test Book")
-
-    def test_get_book_by_isbn_not_found(self):
-        """
-        Test retrieving a book by an ISBN that does not exist.
-
-        This test verifies that attempting to retrieve a book using an ISBN
-        that does not exist in the BookManager returns None.
-        """
-        book = self.book_manager.get_book_by_isbn("9999999999")
-        self.assertIsNone(book)
-
-    def test_update_book(self):
-        """
-        Test updating a book's details.
-
-        This test verifies that a book's title and author can be updated
-        and that the changes are correctly saved.
-        """
-        self.book_manager.add_book("Test Book", "Test Author", "1234567890")
-        self.mock_storage.save_data.reset_mock()  # Reset the mock after add_book
-        updated_book = self.book_manager.update_book("1234567890", title="Updated Book", author="Updated Author")
-        self.assertEqual(updated_book.title, "Updated Book")
-        self.assertEqual(updated_book.author, "Updated Author")
-
-    def test_update_book_not_found(self):
-        """
-        Test updating a book that does not exist.
-
-        This test verifies that attempting to update a book using an ISBN
-        that does not exist in the BookManager raises a ValueError.
-        """
-        with self.assertRaises(ValueError):
-            self.book_manager.update_book("9999999999", title="Updated Book")
-
-    def test_delete_book(self):
-        """
-        Test deleting a book from the BookManager.
-
-        This test verifies that a book can be deleted from the BookManager
-        using its ISBN and that it is removed from the books list.
-        """
-        self.book_manager.add_book("Test Book", "Test Author", "1234567890")
-        self.mock_storage.save_data.reset_mock()  # Reset the mock after add_book
-        self.book_manager.delete_book("1234567890")
-        self.assertEqual(len(self.book_manager.books), 0)
-
-    def test_delete_book_not_found(self):
-        """
-        Test deleting a book that does not exist.
-
-        This test verifies that attempting to delete a book using an ISBN
-        that does not exist in the BookManager raises a ValueError.
-        """
-        with self.assertRaises(ValueError):
-            self.book_manager.delete_book("9999999999")
-
-    def test_search_books(self):
-        """
-        Test searching for books by title.
-
-        This test verifies that books can be searched by a keyword in their title
-        and that the correct books are returned.
-        """
-        self.book_manager.add_book("Python Programming", "John Doe", "1111111111")
-        self.book_manager.add_book("Java Programming", "Jane Smith", "2222222222")
-        results = self.book_manager.search_books("Python")
-        self.assertEqual(len(results), 1)
-        self.assertEqual(results[0].title, "Python Programming")
+def _bulkload(manager, rows):
+    """
+    Load books straight into a BookManager, bypassing add_book.
+
+    Args:
+        manager (BookManager): The manager to load.
+        rows (list): (title, author, isbn) tuples, one per book.
+    """
+    manager.books = [Book(title, author, isbn) for title, author, isbn in rows]
+
+@pytest.fixture
+def book_manager(mock_storage):
+    """
+    Set up the test environment.
+
+    This fixture creates a BookManager instance with the mock storage object.
+    It also clears the books list before each test.
+    """
+    manager = BookManager(storage=mock_storage)
+    manager.books = []  # Clear books for each test
+    return manager
+
+def test_add_book(book_manager):
+    """
+    Test adding a book to the BookManager.
+
+    This test verifies that a book is correctly added to the BookManager
+    and that its attributes are set correctly.
+    """
+    book = book_manager.add_book("Test Book", "Test Author", "1234567890")
+    assert len(book_manager.books) == 1
+    assert book.title == "Test Book"
+    assert book.author == "Test Author"
+    assert book.isbn == "1234567890"
+
+def test_add_book_duplicate_isbn(book_manager):
+    """
+    Test adding a book with a duplicate ISBN.
+
+    This test verifies that adding a book with an ISBN that already exists
+    in the BookManager raises a ValueError.
+    """
+    book_manager.add_book("Test Book", "Test Author", "1234567890")
+    with pytest.raises(ValueError):
+        book_manager.add_book("Another Book", "Another Author", "1234567890")
+
+def test_get_book_by_isbn(book_manager):
+    """
+    Test retrieving a book by its ISBN.
+
+    This test verifies that a book can be retrieved from the BookManager
+    using its ISBN and that the correct book is returned.
+    """
+    book_manager.add_book("Test Book", "Test Author", "1234567890")
+    book = book_manager.get_book_by_isbn("1234567890")
+    assert book is not None
+    assert book.title == "Test Book"
+
+def test_get_book_by_isbn_not_found(book_manager):
+    """
+    Test retrieving a book by an ISBN that does not exist.
+
+    This test verifies that attempting to retrieve a book using an ISBN
+    that does not exist in the BookManager returns None.
+    """
+    book = book_manager.get_book_by_isbn("9999999999")
+    assert book is None
+
+def test_update_book(book_manager, mock_storage):
+    """
+    Test updating a book's details.
+
+    This test verifies that a book's title and author can be updated
+    and that the changes are correctly saved.
+    """
+    book_manager.add_book("Test Book", "Test Author", "1234567890")
+    mock_storage.save_data.reset_mock()  # Reset the mock after add_book
+    updated_book = book_manager.update_book("1234567890", title="Updated Book", author="Updated Author")
+    assert updated_book.title == "Updated Book"
+    assert updated_book.author == "Updated Author"
+    saved_data = mock_storage.save_data.call_args[0][0]
+    assert saved_data[0]["title"] == "Updated Book"
+    assert saved_data[0]["author"] == "Updated Author"
+
+def test_delete_book(book_manager, mock_storage):
+    """
+    Test deleting a book from the BookManager.
+
+    This test verifies that a book can be deleted from the BookManager
+    using its ISBN and that it is removed from the books list.
+    """
+    book_manager.add_book("Test Book", "Test Author", "1234567890")
+    mock_storage.save_data.reset_mock()  # Reset the mock after add_book
+    book_manager.delete_book("1234567890")
+    assert len(book_manager.books) == 0
+
+@pytest.mark.parametrize("operation", [
+    lambda manager: manager.update_book("9999999999", title="Updated Book"),
+    lambda manager: manager.delete_book("9999999999"),
+], ids=["update_book", "delete_book"])
+def test_missing_isbn_raises(book_manager, operation):
+    """
+    Test updating or deleting a book that does not exist.
+
+    This test verifies that each operation raises a ValueError when given
+    an ISBN that does not exist in the BookManager.
+    """
+    with pytest.raises(ValueError):
+        operation(book_manager)
+
+def test_delete_book_frees_isbn(book_manager):
+    """
+    Test that deleting a book removes it from the ISBN index.
+
+    This test verifies that a deleted book can no longer be retrieved by its ISBN
+    and that the ISBN can be reused for a new book.
+    """
+    book_manager.add_book("Test Book", "Test Author", "1234567890")
+    book_manager.delete_book("1234567890")
+    assert book_manager.get_book_by_isbn("1234567890") is None
+    book = book_manager.add_book("New Book", "New Author", "1234567890")
+    assert book_manager.get_book_by_isbn("1234567890") is book
+
+def test_books_setter_indexes_by_isbn(book_manager):
+    """
+    Test assigning a list of books to the BookManager.
+
+    This test verifies that assigned books are indexed by ISBN, so each one
+    can be retrieved directly and duplicates are rejected.
+    """
+    book1 = Book("Book 1", "Author 1", "1111111111")
+    book2 = Book("Book 2", "Author 2", "2222222222")
+    book_manager.books = [book1, book2]
+    assert book_manager.get_book_by_isbn("1111111111") is book1
+    assert book_manager.get_book_by_isbn("2222222222") is book2
+    with pytest.raises(ValueError):
+        book_manager.add_book("Another Book", "Another Author", "2222222222")
+
+def test_books_setter_accepts_getter_value(book_manager):
+    """
+    Test assigning the books dict returned by the getter back to the BookManager.
+
+    This test verifies that reading the books and assigning them back keeps
+    the same books indexed by ISBN.
+    """
+    book = book_manager.add_book("Test Book", "Test Author", "1234567890")
+    book_manager.books = book_manager.books
+    assert book_manager.books == {"1234567890": book}
+
+def test_search_books(book_manager):
+    """
+    Test searching for books by title.
+
+    This test verifies that books can be searched by a keyword in their title
+    and that the correct books are returned.
+    """
+    _bulkload(book_manager, [
+        ("Python Programming", "John Doe", "1111111111"),
+        ("Java Programming", "Jane Smith", "2222222222"),
+    ])
+    results = book_manager.search_books("Python")
+    assert len(results) == 1
+    assert results[0].title == "Python Programming"
+
+def test_search_books_after_update(book_manager):
+    """
+    Test searching for a book after its title has been updated.
+
+    This test verifies that searches match the new title and no longer match the old one.
+    """
+    book_manager.add_book("Python Programming", "John Doe", "1111111111")
+    book_manager.update_book("1111111111", title="Rust Programming")
+    assert book_manager.search_books("Python") == []
+    assert len(book_manager.search_books("rust")) == 1
+
+def test_book_setters_refresh_search_and_saved_data(book_manager):
+    """
+    Test changing a book's title and author directly.
+
+    This test verifies that the setters refresh both the search key and the
+    cached dictionary, without going through BookManager.update_book.
+    """
+    book = book_manager.add_book("Python Programming", "John Doe", "1111111111")
+    book.to_dict()  # Populate the cached dictionary
+    book.title = "Rust Programming"
+    book.author = "Jane Smith"
+    assert book_manager.search_books("python") == []
+    assert book_manager.search_books("jane") == [book]
+    assert book.to_dict()["title"] == "Rust Programming"
+    assert book.to_dict()["author"] == "Jane Smith"
+
+def test_book_has_no_instance_dict():
+    """
+    Test that Book instances are slotted.
+
+    This test verifies that Book keeps its attributes in __slots__ and
+    rejects attributes it does not declare.
+    """
+    book = Book("Test Book", "Test Author", "1234567890")
+    assert not hasattr(book, "__dict__")
+    with pytest.raises(AttributeError):
+        book.publisher = "Test Publisher"
+
+def test_batch_defers_save(book_manager, mock_storage):
+    """
+    Test that a batch writes the books to storage only once.
+
+    This test verifies that changes made inside a batch are not saved until
+    the batch exits, and that they are then saved in a single write.
+    """
+    with book_manager.batch():
+        book_manager.add_book("Test Book 1", "Test Author", "1111111111")
+        book_manager.add_book("Test Book 2", "Test Author", "2222222222")
+        mock_storage.save_data.assert_not_called()
+    mock_storage.save_data.assert_called_once()
+    assert len(mock_storage.save_data.call_args[0][0]) == 2
 
 if __name__ == '__main__':
-    unittest.main()
+    pytest.main([__file__])
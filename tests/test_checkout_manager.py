@@ -1,183 +1,358 @@
-import unittest
-from unittest.mock import patch, MagicMock
+"""
+Unit tests for the CheckoutManager class.
+
+These tests verify the functionality of the CheckoutManager class,
+ensuring that books can be checked out, returned, and managed correctly.
+"""
+import copy
+import pytest
+from unittest.mock import patch
 from library.managers.checkout_manager import CheckoutManager
-from library.managers.book_manager import BookManager
-from library.managers.user_manager import UserManager
+from library.storage import LogStorage, Storage
 from library.book import Book
 from library.user import User
 from library.checkout import Checkout
 from datetime import datetime, timedelta
 
-class TestCheckoutManager(unittest.TestCase):
-    """
-    Unit test case for the CheckoutManager class.
-
-    This test case verifies the functionality of the CheckoutManager class,
-    ensuring that books can be checked out, returned, and managed correctly.
-    """
-
-    def setUp(self):
-        """
-        Set up the test environment.
-
-        This method initializes mock objects for storage, book manager, and user manager,
-        and creates an instance of CheckoutManager with these mocks. It also clears the
-        checkouts list before each test.
-        """
-        self.mock_storage = MagicMock()
-        self.mock_book_manager = MagicMock(spec=BookManager)
-        self.mock_user_manager = MagicMock(spec=UserManager)
-        self.checkout_manager = CheckoutManager(self.mock_book_manager, self.mock_user_manager)
-        self.checkout_manager.storage = self.mock_storage
-        self.checkout_manager.checkouts = []  # Clear checkouts for each test
-
-    def test_checkout_book(self):
-        """
-        Test checking out a book.
-
-        This test verifies that a book can be checked out by a user, the checkout is
-        recorded, and the book's availability status is updated.
-        """
-        mock_user = User("Test User", "1")
-        mock_book = Book("Test Book", "Test Author", "1234567890")
-        mock_book.available = True
-        
-        self.mock_user_manager.get_user_by_id.return_value = mock_user
-        self.mock_book_manager.get_book_by_isbn.return_value = mock_book
-
-        checkout = self.checkout_manager.checkout_book("1", "1234567890")
-        
-        self.assertEqual(len(self.checkout_manager.checkouts), 1)
-        self.assertEqual(checkout.user, mock_user)
-        self.assertEqual(checkout.book, mock_book)
-        self.assertFalse(mock_book.available)
-
-    def test_checkout_book_user_not_found(self):
-        """
-        Test checking out a book with a non-existent user.
-
-        This test verifies that attempting to check out a book with a user ID that
-        does not exist in the user manager raises a ValueError.
-        """
-        self.mock_user_manager.get_user_by_id.return_value = None
-        
-        with self.assertRaises(ValueError):
-            self.checkout_manager.checkout_book("999", "1234567890")
-
-    def test_checkout_book_book_not_found(self):
-        """
-        Test checking out a non-existent book.
-
-        This test verifies that attempting to check out a book with an ISBN that
-        does not exist in the book manager raises a ValueError.
-        """
-        mock_user = User("Test User", "1")
-        self.mock_user_manager.get_user_by_id.return_value = mock_user
-        self.mock_book_manager.get_book_by_isbn.return_value = None
-        
-        with self.assertRaises(ValueError):
-            self.checkout_manager.checkout_book("1", "9999999999")
-
-    def test_checkout_book_not_available(self):
-        """
-        Test checking out a book that is not available.
-
-        This test verifies that attempting to check out a book that is already
-        checked out (not available) raises a ValueError.
-        """
-        mock_user = User("Test User", "1")
-        mock_book = Book("Test Book", "Test Author", "1234567890")
-        mock_book.available = False
-        
-        self.mock_user_manager.get_user_by_id.return_value = mock_user
-        self.mock_book_manager.get_book_by_isbn.return_value = mock_book
-        
-        with self.assertRaises(ValueError):
-            self.checkout_manager.checkout_book("1", "1234567890")
-
-    def test_return_book(self):
-        """
-        Test returning a book.
-
-        This test verifies that a book can be returned, the checkout record is
-        removed, and the book's availability status is updated.
-        """
-        mock_user = User("Test User", "1")
-        mock_book = Book("Test Book", "Test Author", "1234567890")
-        mock_book.available = False
-        checkout = Checkout(mock_user, mock_book)
-        self.checkout_manager.checkouts.append(checkout)
-
-        self.checkout_manager.return_book("1234567890")
-        
-        self.assertEqual(len(self.checkout_manager.checkouts), 0)
-        self.assertTrue(mock_book.available)
-
-    def test_return_book_not_found(self):
-        """
-        Test returning a non-existent book.
-
-        This test verifies that attempting to return a book with an ISBN that
-        does not have a corresponding checkout record raises a ValueError.
-        """
-        with self.assertRaises(ValueError):
-            self.checkout_manager.return_book("9999999999")
-
-    def test_get_checked_out_books(self):
-        """
-        Test getting all checked-out books.
-
-        This test verifies that all currently checked-out books can be retrieved
-        and that the correct books are returned.
-        """
-        mock_user = User("Test User", "1")
-        mock_book1 = Book("Test Book 1", "Test Author 1", "1111111111")
-        mock_book2 = Book("Test Book 2", "Test Author 2", "2222222222")
-        mock_book1.available = False
-        mock_book2.available = False
-        
-        self.checkout_manager.checkouts = [
-            Checkout(mock_user, mock_book1),
-            Checkout(mock_user, mock_book2)
-        ]
-
-        checked_out_books = self.checkout_manager.get_checked_out_books()
-        
-        self.assertEqual(len(checked_out_books), 2)
-        self.assertIn(mock_book1, checked_out_books)
-        self.assertIn(mock_book2, checked_out_books)
-
-    def test_load_checkouts(self):
-        """
-        Test loading checkouts from storage.
-
-        This test verifies that checkout records can be loaded from storage,
-        and the corresponding user and book objects are correctly instantiated.
-        """
-        mock_checkout_data = [
-            {
-                "user_id": "1",
-                "book_isbn": "1234567890",
-                "checkout_date": datetime.now().isoformat(),
-                "due_date": (datetime.now() + timedelta(days=14)).isoformat()
-            }
-        ]
-        self.mock_storage.load_data.return_value = mock_checkout_data
-        
-        mock_user = User("Test User", "1")
-        mock_book = Book("Test Book", "Test Author", "1234567890")
-        self.mock_user_manager.get_user_by_id.return_value = mock_user
-        self.mock_book_manager.get_book_by_isbn.return_value = mock_book
-
-        # Patch the _load_checkouts method to use our mocked data
-        with patch.object(CheckoutManager, '_load_checkouts', return_value=[Checkout(mock_user, mock_book)]):
-            checkout_manager = CheckoutManager(self.mock_book_manager, self.mock_user_manager)
-            checkout_manager.storage = self.mock_storage
-
-            self.assertEqual(len(checkout_manager.checkouts), 1)
-            loaded_checkout = checkout_manager.checkouts[0]
-            self.assertEqual(loaded_checkout.user, mock_user)
-            self.assertEqual(loaded_checkout.book, mock_book)
+# Fixed timestamps so stored checkout records are deterministic
+_NOW = datetime(2024, 1, 1, 12, 0, 0)
+_DUE = _NOW + timedelta(days=14)
+_NOW_ISO = _NOW.isoformat()
+_DUE_ISO = _DUE.isoformat()
+
+# Shared test user and book; tests copy the book because checkouts change its availability
+_USER = User("Test User", "1")
+_BOOK = Book("Test Book", "Test Author", "1234567890")
+
+@pytest.fixture
+def checkout_manager(mock_storage, book_manager_mock, user_manager_mock):
+    """
+    Set up the test environment.
+
+    This fixture creates an instance of CheckoutManager with the mock storage object
+    and the shared book manager and user manager mocks from conftest.py. It also clears
+    the checkouts list before each test.
+    """
+    manager = CheckoutManager(book_manager_mock, user_manager_mock)
+    manager.storage = mock_storage
+    manager.checkouts = []  # Clear checkouts for each test
+    return manager
+
+def test_checkout_book(checkout_manager, book_manager_mock, user_manager_mock):
+    """
+    Test checking out a book.
+
+    This test verifies that a book can be checked out by a user, the checkout is
+    recorded, and the book's availability status is updated.
+    """
+    mock_user = _USER
+    mock_book = copy.copy(_BOOK)
+    mock_book.available = True
+    
+    user_manager_mock.get_user_by_id.return_value = mock_user
+    book_manager_mock.get_book_by_isbn.return_value = mock_book
+
+    checkout = checkout_manager.checkout_book("1", "1234567890")
+    
+    assert len(checkout_manager.checkouts) == 1
+    assert checkout.user == mock_user
+    assert checkout.book == mock_book
+    assert not mock_book.available
+
+def _unavailable_book():
+    """
+    Return a copy of the shared test book that is already checked out.
+    """
+    book = copy.copy(_BOOK)
+    book.available = False
+    return book
+
+@pytest.mark.parametrize("user, book", [
+    (None, copy.copy(_BOOK)),
+    (_USER, None),
+    (_USER, _unavailable_book()),
+], ids=["user not found", "book not found", "book not available"])
+def test_checkout_book_invalid(checkout_manager, book_manager_mock, user_manager_mock, user, book):
+    """
+    Test checking out a book that cannot be checked out.
+
+    This test verifies that attempting to check out a book raises a ValueError when
+    the user ID or the ISBN does not exist in its manager, or when the book is
+    already checked out (not available).
+    """
+    user_manager_mock.get_user_by_id.return_value = user
+    book_manager_mock.get_book_by_isbn.return_value = book
+    with pytest.raises(ValueError):
+        checkout_manager.checkout_book("1", "1234567890")
+
+def test_return_book(checkout_manager):
+    """
+    Test returning a book.
+
+    This test verifies that a book can be returned, the checkout record is
+    removed, and the book's availability status is updated.
+    """
+    mock_user = _USER
+    mock_book = copy.copy(_BOOK)
+    mock_book.available = False
+    checkout = Checkout(mock_user, mock_book)
+    checkout_manager.checkouts = [checkout]
+
+    checkout_manager.return_book("1234567890")
+    
+    assert len(checkout_manager.checkouts) == 0
+    assert mock_book.available
+
+def test_return_book_not_found(checkout_manager):
+    """
+    Test returning a non-existent book.
+
+    This test verifies that attempting to return a book with an ISBN that
+    does not have a corresponding checkout record raises a ValueError.
+    """
+    with pytest.raises(ValueError):
+        checkout_manager.return_book("9999999999")
+
+def test_checkouts_setter_accepts_getter_value(checkout_manager):
+    """
+    Test assigning the checkouts dict returned by the getter back to the CheckoutManager.
+
+    This test verifies that reading the checkouts and assigning them back keeps
+    the same checkouts indexed by book ISBN.
+    """
+    checkout = Checkout(_USER, copy.copy(_BOOK))
+    checkout_manager.checkouts = [checkout]
+    checkout_manager.checkouts = checkout_manager.checkouts
+    assert checkout_manager.checkouts == {"1234567890": checkout}
+
+def test_batch_defers_log_writes(checkout_manager, mock_storage, book_manager_mock, user_manager_mock):
+    """
+    Test that a batch writes the checkout log only once.
+
+    This test verifies that a checkout and a return made inside a batch are not
+    appended until the batch exits, that they are then appended in a single call
+    as an "out" record followed by an "in" record, and that the book manager is
+    batched together with the checkouts.
+    """
+    book = copy.copy(_BOOK)
+    user_manager_mock.get_user_by_id.return_value = _USER
+    book_manager_mock.get_book_by_isbn.return_value = book
+    book_batch = book_manager_mock.batch.return_value
+
+    with checkout_manager.batch():
+        book_batch.__enter__.assert_called_once()
+        checkout_manager.checkout_book("1", "1234567890")
+        checkout_manager.return_book("1234567890")
+        mock_storage.append_data.assert_not_called()
+        book_batch.__exit__.assert_not_called()
+
+    book_batch.__exit__.assert_called_once()
+    mock_storage.append_data.assert_called_once()
+    mock_storage.save_data.assert_not_called()
+    records = mock_storage.append_data.call_args[0][0]
+    assert [record["op"] for record in records] == ["out", "in"]
+    assert [record["book_isbn"] for record in records] == ["1234567890", "1234567890"]
+
+def test_get_checked_out_books(checkout_manager):
+    """
+    Test getting all checked-out books.
+
+    This test verifies that all currently checked-out books can be retrieved
+    and that the correct books are returned.
+    """
+    mock_user = _USER
+    mock_book1 = Book("Test Book 1", "Test Author 1", "1111111111")
+    mock_book2 = Book("Test Book 2", "Test Author 2", "2222222222")
+    mock_book1.available = False
+    mock_book2.available = False
+    
+    checkout_manager.checkouts = [
+        Checkout(mock_user, mock_book1),
+        Checkout(mock_user, mock_book2)
+    ]
+
+    checked_out_books = checkout_manager.get_checked_out_books()
+    
+    assert len(checked_out_books) == 2
+    assert set(checked_out_books) == {mock_book1, mock_book2}
+
+def test_checkout_has_no_instance_dict():
+    """
+    Test that Checkout instances are slotted.
+
+    This test verifies that Checkout keeps its attributes in __slots__ and
+    rejects attributes it does not declare.
+    """
+    checkout = Checkout(_USER, copy.copy(_BOOK))
+    assert not hasattr(checkout, "__dict__")
+    with pytest.raises(AttributeError):
+        checkout.return_date = _DUE
+
+def test_load_checkouts(mock_storage, book_manager_mock, user_manager_mock):
+    """
+    Test loading checkouts from storage.
+
+    This test verifies that checkout records can be loaded from storage,
+    and the corresponding user and book objects are correctly instantiated.
+    """
+    mock_checkout_data = [
+        {
+            "user_id": "1",
+            "book_isbn": "1234567890",
+            "checkout_date": _NOW_ISO,
+            "due_date": _DUE_ISO
+        }
+    ]
+    mock_storage.load_data.return_value = mock_checkout_data
+    
+    mock_user = _USER
+    mock_book = copy.copy(_BOOK)
+    user_manager_mock.get_user_by_id.return_value = mock_user
+    book_manager_mock.get_book_by_isbn.return_value = mock_book
+
+    # Patch the _load_checkouts method to use our mocked data
+    with patch.object(CheckoutManager, '_load_checkouts', return_value=[Checkout(mock_user, mock_book)]):
+        checkout_manager = CheckoutManager(book_manager_mock, user_manager_mock)
+        checkout_manager.storage = mock_storage
+
+        assert len(checkout_manager.checkouts) == 1
+        loaded_checkout = checkout_manager.checkouts["1234567890"]
+        assert loaded_checkout.user == mock_user
+        assert loaded_checkout.book == mock_book
+
+def test_checkout_and_return_append_to_log(checkout_manager, mock_storage, book_manager_mock, user_manager_mock):
+    """
+    Test that checkouts and returns are appended to the checkout log.
+
+    This test verifies that each operation appends a single record to storage
+    instead of rewriting all stored checkouts.
+    """
+    mock_user = _USER
+    mock_book = copy.copy(_BOOK)
+    user_manager_mock.get_user_by_id.return_value = mock_user
+    book_manager_mock.get_book_by_isbn.return_value = mock_book
+
+    checkout_manager.checkout_book("1", "1234567890")
+    checkout_manager.return_book("1234567890")
+
+    mock_storage.save_data.assert_not_called()
+    records = [c[0][0][0] for c in mock_storage.append_data.call_args_list]
+    assert [r["op"] for r in records] == ["out", "in"]
+    assert records[1]["book_isbn"] == "1234567890"
+
+def test_load_checkouts_replays_log(mock_storage, book_manager_mock, user_manager_mock):
+    """
+    Test loading checkouts from a log that contains returns.
+
+    This test verifies that a return record closes the checkout opened earlier in the log,
+    and that records for books that no longer exist are skipped.
+    """
+    books = {
+        "1111111111": Book("Test Book 1", "Test Author", "1111111111"),
+        "2222222222": Book("Test Book 2", "Test Author", "2222222222"),
+    }
+    mock_storage.load_data.return_value = [
+        {"op": "out", "user_id": "1", "book_isbn": "1111111111", "checkout_date": _NOW_ISO, "due_date": _DUE_ISO},
+        {"op": "out", "user_id": "1", "book_isbn": "2222222222", "checkout_date": _NOW_ISO, "due_date": _DUE_ISO},
+        {"op": "in", "book_isbn": "1111111111"},
+        {"op": "out", "user_id": "1", "book_isbn": "9999999999", "checkout_date": _NOW_ISO, "due_date": _DUE_ISO},
+    ]
+    user_manager_mock.get_user_by_id.return_value = _USER
+    book_manager_mock.get_book_by_isbn.side_effect = books.get
+
+    checkout_manager = CheckoutManager(book_manager_mock, user_manager_mock)
+    checkout_manager.storage = mock_storage
+
+    assert len(checkout_manager.checkouts) == 1
+    assert list(checkout_manager.checkouts) == ["2222222222"]
+    assert checkout_manager.checkouts["2222222222"].book is books["2222222222"]
+    assert checkout_manager.checkouts["2222222222"].due_date == _DUE
+
+def test_load_checkouts_migrates_legacy_file(tmp_path, book_manager_mock, user_manager_mock):
+    """
+    Test loading checkouts saved by an older version as a single JSON list.
+
+    This test verifies that when there is no checkout log yet, the legacy checkouts
+    file is loaded and compacted into a new log, so books checked out before the
+    upgrade can still be returned.
+    """
+    legacy_path = tmp_path / "checkouts_data.json"
+    log_path = tmp_path / "checkouts_data.jsonl"
+    Storage(str(legacy_path)).save_data([
+        {"user_id": "1", "book_isbn": "1234567890", "checkout_date": _NOW_ISO, "due_date": _DUE_ISO}
+    ])
+    book = _unavailable_book()
+    user_manager_mock.get_user_by_id.return_value = _USER
+    book_manager_mock.get_book_by_isbn.return_value = book
+
+    checkout_manager = CheckoutManager(book_manager_mock, user_manager_mock)
+    checkout_manager.storage = LogStorage(str(log_path))
+    checkout_manager.legacy_storage = Storage(str(legacy_path))
+
+    assert list(checkout_manager.checkouts) == ["1234567890"]
+    assert LogStorage(str(log_path)).load_data() == [
+        {"user_id": "1", "book_isbn": "1234567890", "checkout_date": _NOW_ISO, "due_date": _DUE_ISO}
+    ]
+
+    checkout_manager.return_book("1234567890")
+    assert book.available
+    reloaded = CheckoutManager(book_manager_mock, user_manager_mock)
+    reloaded.storage = LogStorage(str(log_path))
+    reloaded.legacy_storage = Storage(str(legacy_path))
+    assert reloaded.checkouts == {}
+
+def test_load_checkouts_ignores_legacy_file_once_log_exists(tmp_path, book_manager_mock, user_manager_mock):
+    """
+    Test loading checkouts when both the log and the legacy file exist.
+
+    This test verifies that the legacy file is only read before the first log is
+    written, so checkouts returned since the migration are not brought back.
+    """
+    legacy_path = tmp_path / "checkouts_data.json"
+    log_path = tmp_path / "checkouts_data.jsonl"
+    Storage(str(legacy_path)).save_data([
+        {"user_id": "1", "book_isbn": "1234567890", "checkout_date": _NOW_ISO, "due_date": _DUE_ISO}
+    ])
+    log_path.write_bytes(b"")
+
+    checkout_manager = CheckoutManager(book_manager_mock, user_manager_mock)
+    checkout_manager.storage = LogStorage(str(log_path))
+    checkout_manager.legacy_storage = Storage(str(legacy_path))
+
+    assert checkout_manager.checkouts == {}
+    book_manager_mock.get_book_by_isbn.assert_not_called()
+
+def test_log_compacts_past_threshold(tmp_path, book_manager_mock, user_manager_mock):
+    """
+    Test the checkout log against a real file as it grows.
+
+    This test verifies that checkouts and returns are appended as "out" and "in"
+    records, and that the log is rewritten with only the active checkouts once it
+    holds more than twice the active checkouts plus COMPACT_MIN_RECORDS records.
+    """
+    log_path = tmp_path / "checkouts_data.jsonl"
+    book = copy.copy(_BOOK)
+    user_manager_mock.get_user_by_id.return_value = _USER
+    book_manager_mock.get_book_by_isbn.return_value = book
+
+    checkout_manager = CheckoutManager(book_manager_mock, user_manager_mock)
+    checkout_manager.storage = LogStorage(str(log_path))
+    checkout_manager.COMPACT_MIN_RECORDS = 2
+
+    def stored_ops():
+        return [record.get("op") for record in LogStorage(str(log_path)).load_data()]
+
+    checkout_manager.checkout_book("1", "1234567890")
+    assert stored_ops() == ["out"]
+    checkout_manager.return_book("1234567890")
+    assert stored_ops() == ["out", "in"]
+    checkout_manager.checkout_book("1", "1234567890")
+    assert stored_ops() == ["out", "in", "out"]
+    # Four records with no active checkouts exceeds 2 * 0 + 2, so the log is compacted
+    checkout_manager.return_book("1234567890")
+    assert stored_ops() == []
+    checkout_manager.checkout_book("1", "1234567890")
+    assert stored_ops() == ["out"]
 
 if __name__ == '__main__':
-    unittest.main()
+    pytest.main([__file__])
@@ -1,219 +1,269 @@
-import unittest
-from unittest.mock import patch, MagicMock, call
-from io import StringIO
+"""
+Unit tests for the LibrarySystem class.
+
+These tests verify the functionality of the LibrarySystem class,
+ensuring that book and user management, as well as checkouts, are handled correctly.
+"""
+import re
+import pytest
+from unittest.mock import MagicMock
+from main import LibrarySystem
 from library.managers.book_manager import BookManager
 from library.managers.user_manager import UserManager
 from library.managers.checkout_manager import CheckoutManager
-from main import LibrarySystem
+from tests.conftest import BOOK_MANAGER_METHODS, USER_MANAGER_METHODS, CHECKOUT_MANAGER_METHODS
+
+# Messages the run loop prints, checked against a single read of captured stdout
+EXIT_MSG = "Exiting. Goodbye!"
+INVALID_CHOICE_MSG = "Invalid choice, please try again."
+
+# ANSI escape sequences: colorama's color codes and the clear-screen sequence
+_ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+
+def _lines(out):
+    """
+    Split captured output into a set of lines for exact-line membership checks.
+
+    main enables colors when stdout is a terminal at import time (e.g. under
+    `pytest -s`), so escape sequences are stripped before splitting.
+    """
+    return set(_ANSI_ESCAPE.sub("", out).splitlines())
+
+class _Item:
+    """
+    Lightweight stand-in for a Book or User in tests that only display it.
+
+    Only __str__ and the available flag are read when listing or searching,
+    so there is no need for a full MagicMock.
+    """
+    __slots__ = ('_text', 'available')
+
+    def __init__(self, text, available=True):
+        self._text = text
+        self.available = available
+
+    def __str__(self):
+        return self._text
+
+@pytest.fixture(scope="module")
+def shared_library_system():
+    """
+    Build one LibrarySystem for the whole module.
+
+    Each test swaps fresh manager mocks into it, so no state carries over.
+    """
+    return LibrarySystem()
+
+@pytest.fixture
+def library_system(shared_library_system, book_manager_mock, user_manager_mock, checkout_manager_mock):
+    """
+    Set up the test environment.
+
+    This fixture points the module's LibrarySystem at the shared book, user
+    and checkout manager mocks from conftest.py.
+    """
+    shared_library_system.book_manager = book_manager_mock
+    shared_library_system.user_manager = user_manager_mock
+    shared_library_system.checkout_manager = checkout_manager_mock
+    return shared_library_system
+
+@pytest.mark.parametrize("manager_class, methods", [
+    (BookManager, BOOK_MANAGER_METHODS),
+    (UserManager, USER_MANAGER_METHODS),
+    (CheckoutManager, CHECKOUT_MANAGER_METHODS),
+], ids=["BookManager", "UserManager", "CheckoutManager"])
+def test_manager_mock_specs_match_managers(manager_class, methods):
+    """
+    Test the method lists used to spec the manager mocks.
+
+    This test verifies that every listed name is a callable attribute of its manager
+    class, so renaming or removing a manager method cannot leave the mocks, and the
+    tests that use them, accepting the old name.
+    """
+    missing = [name for name in methods if not callable(getattr(manager_class, name, None))]
+    assert missing == []
+
+def test_run_manage_books(library_system, inputs, capsys):
+    """
+    Test running the library system with a sequence of inputs to manage books.
+
+    This test verifies that the library system can handle book management and exit correctly.
+    """
+    inputs(['1', '8', '3'])
+    library_system.run()
+    out = capsys.readouterr().out
+    assert EXIT_MSG in out
+
+def test_run_manage_users(library_system, inputs, capsys):
+    """
+    Test running the library system with a sequence of inputs to manage users.
+
+    This test verifies that the library system can handle user management and exit correctly.
+    """
+    inputs(['2', '6', '3'])
+    library_system.run()
+    out = capsys.readouterr().out
+    assert EXIT_MSG in out
+
+def test_run_exit_from_manage_books(library_system, inputs, capsys):
+    """
+    Test exiting the library system from the book management menu.
+
+    This test verifies that choosing Exit in a submenu ends the run loop without raising SystemExit.
+    """
+    inputs(['1', '9'])
+    library_system.run()
+    out = capsys.readouterr().out
+    assert EXIT_MSG in out
+
+def test_run_invalid_choice(library_system, inputs, capsys):
+    """
+    Test running the library system with an invalid menu choice.
+
+    This test verifies that the library system handles invalid menu choices by prompting the user again.
+    """
+    inputs(['4', '', '3'])
+    library_system.run()
+    out = capsys.readouterr().out
+    assert INVALID_CHOICE_MSG in out
+    assert EXIT_MSG in out
+
+def test_add_book(library_system, book_manager_mock, inputs):
+    """
+    Test adding a book to the library system.
 
-class TestLibrarySystem(unittest.TestCase):
-    """
-    Unit test case for the LibrarySystem class.
-
-    This test case verifies the functionality of the LibrarySystem class,
-    ensuring that book and user management, as well as checkouts, are handled correctly.
-    """
-
-    def setUp(self):
-        """
-        Set up the test environment.
-
-        This method initializes mock objects for book manager, user manager, and checkout manager,
-        and creates an instance of LibrarySystem with these mocks.
-        """
-        self.book_manager = MagicMock(spec=BookManager)
-        self.user_manager = MagicMock(spec=UserManager)
-        self.checkout_manager = MagicMock(spec=CheckoutManager)
-        
-        # Create a LibrarySystem instance with mocked managers
-        self.library_system = LibrarySystem()
-        self.library_system.book_manager = self.book_manager
-        self.library_system.user_manager = self.user_manager
-        self.library_system.checkout_manager = self.checkout_manager
-
-    @patch('builtins.input', side_effect=['1', '8', '3'])
-    def test_run_manage_books(self, mock_input):
-        """
-        Test running the library system with a sequence of inputs to manage books.
-
-        This test verifies that the library system can handle book management and exit correctly.
-        """
-        with patch('sys.stdout', new=StringIO()) as fake_out:
-            self.library_system.run()
-            self.assertIn("Exiting. Goodbye!", fake_out.getvalue())
-
-    @patch('builtins.input', side_effect=['2', '6', '3'])
-    def test_run_manage_users(self, mock_input):
-        """
-        Test running the library system with a sequence of inputs to manage users.
-
-        This test verifies that the library system can handle user management and exit correctly.
-        """
-        with patch('sys.stdout', new=StringIO()) as fake_out:
-            self.library_system.run()
-            self.assertIn("Exiting. Goodbye!", fake_out.getvalue())
-
-    @patch('builtins.input', side_effect=['4', '3'])
-    def test_run_invalid_choice(self, mock_input):
-        """
-        Test running the library system with an invalid menu choice.
-
-        This test verifies that the library system handles invalid menu choices by prompting the user again.
-        """
-        with patch('sys.stdout', new=StringIO()) as fake_out:
-            self.library_system.run()
-            self.assertIn("Invalid choice, please try again.", fake_out.getvalue())
-
-    @patch('builtins.input', side_effect=['Test Book', 'Test Author', '1234567890'])
-    def test_add_book(self, mock_input):
-        """
-        Test adding a book to the library system.
-
-        This test verifies that a book can be added correctly by calling the book manager's add_book method.
-        """
-        self.book_manager.add_book.return_value = MagicMock()
-        self.library_system.add_book()
-        self.book_manager.add_book.assert_called_once_with('Test Book', 'Test Author', '1234567890')
-
-    @patch('builtins.input', side_effect=['1234567890', 'New Title', 'New Author'])
-    def test_update_book(self, mock_input):
-        """
-        Test updating a book in the library system.
-
-        This test verifies that a book's information can be updated correctly by calling the book manager's update_book method.
-        """
-        self.book_manager.update_book.return_value = MagicMock()
-        self.library_system.update_book()
-        self.book_manager.update_book.assert_called_once_with('1234567890', 'New Title', 'New Author')
-
-    @patch('builtins.input', return_value='1234567890')
-    def test_delete_book(self, mock_input):
-        """
-        Test deleting a book from the library system.
-
-        This test verifies that a book can be deleted correctly by calling the book manager's delete_book method.
-        """
-        self.library_system.delete_book()
-        self.book_manager.delete_book.assert_called_once_with('1234567890')
-
-    def test_list_books(self):
-        """
-        Test listing all books in the library system.
-
-        This test verifies that the list of books is correctly retrieved and displayed, showing their availability status.
-        """
-        mock_book1 = MagicMock()
-        mock_book1.__str__.return_value = "Book 1"
-        mock_book1.available = True
-        mock_book2 = MagicMock()
-        mock_book2.__str__.return_value = "Book 2"
-        mock_book2.available = False
-        self.book_manager.list_books.return_value = [mock_book1, mock_book2]
-        
-        with patch('sys.stdout', new=StringIO()) as fake_out:
-            self.library_system.list_books()
-            self.assertIn("Book 1 - Status: Available ✅", fake_out.getvalue())
-            self.assertIn("Book 2 - Status: Checked Out ❌", fake_out.getvalue())
-
-    @patch('builtins.input', side_effect=['Test User'])
-    def test_add_user(self, mock_input):
-        """
-        Test adding a user to the library system.
-
-        This test verifies that a user can be added correctly by calling the user manager's add_user method.
-        """
-        self.user_manager.add_user.return_value = MagicMock()
-        self.library_system.add_user()
-        self.user_manager.add_user.assert_called_once_with('Test User')
-
-    @patch('builtins.input', side_effect=['1', 'New Name'])
-    def test_update_user(self, mock_input):
-        """
-        Test updating a user in the library system.
-
-        This test verifies that a user's information can be updated correctly by calling the user manager's update_user method.
-        """
-        self.user_manager.update_user.return_value = MagicMock()
-        self.library_system.update_user()
-        self.user_manager.update_user.assert_called_once_with('1', 'New Name')
-
-    @patch('builtins.input', return_value='1')
-    def test_delete_user(self, mock_input):
-        """
-        Test deleting a user from the library system.
-
-        This test verifies that a user can be deleted correctly by calling the user manager's delete_user method.
-        """
-        self.library_system.delete_user()
-        self.user_manager.delete_user.assert_called_once_with('1')
-
-    def test_list_users(self):
-        """
-        Test listing all users in the library system.
-
-        This test verifies that the list of users is correctly retrieved and displayed.
-        """
-        mock_user1 = MagicMock()
-        mock_user1.__str__.return_value = "User 1"
-        mock_user2 = MagicMock()
-        mock_user2.__str__.return_value = "User 2"
-        self.user_manager.list_users.return_value = [mock_user1, mock_user2]
-        
-        with patch('sys.stdout', new=StringIO()) as fake_out:
-            self.library_system.list_users()
-            self.assertIn("User 1", fake_out.getvalue())
-            self.assertIn("User 2", fake_out.getvalue())
-
-    @patch('builtins.input', side_effect=['1', '1234567890'])
-    def test_checkout_book(self, mock_input):
-        """
-        Test checking out a book from the library system.
-
-        This test verifies that a book can be checked out correctly by calling the checkout manager's checkout_book method.
-        """
-        self.checkout_manager.checkout_book.return_value = MagicMock()
-        self.library_system.checkout_book()
-        self.checkout_manager.checkout_book.assert_called_once_with('1', '1234567890')
-
-    @patch('builtins.input', return_value='1234567890')
-    def test_return_book(self, mock_input):
-        """
-        Test returning a book to the library system.
-
-        This test verifies that a book can be returned correctly by calling the checkout manager's return_book method.
-        """
-        self.library_system.return_book()
-        self.checkout_manager.return_book.assert_called_once_with('1234567890')
-
-    @patch('builtins.input', side_effect=['1', '1234567890'])
-    def test_search_book(self, mock_input):
-        """
-        Test searching for a book in the library system.
-
-        This test verifies that a book can be found correctly by calling the book manager's get_book_by_isbn method.
-        """
-        mock_book = MagicMock()
-        mock_book.__str__.return_value = "Test Book"
-        self.book_manager.get_book_by_isbn.return_value = mock_book
-        
-        with patch('sys.stdout', new=StringIO()) as fake_out:
-            self.library_system.search_book()
-            self.assertIn("Test Book", fake_out.getvalue())
-
-    @patch('builtins.input', side_effect=['1', '1'])
-    def test_search_user(self, mock_input):
-        """
-        Test searching for a user in the library system.
-
-        This test verifies that a user can be found correctly by calling the user manager's get_user_by_id method.
-        """
-        mock_user = MagicMock()
-        mock_user.__str__.return_value = "Test User"
-        self.user_manager.get_user_by_id.return_value = mock_user
-        
-        with patch('sys.stdout', new=StringIO()) as fake_out:
-            self.library_system.search_user()
-            self.assertIn("Test User", fake_out.getvalue())
+    This test verifies that a book can be added correctly by calling the book manager's add_book method.
+    """
+    inputs(['Test Book', 'Test Author', '1234567890'])
+    book_manager_mock.add_book.return_value = MagicMock()
+    library_system.add_book()
+    book_manager_mock.add_book.assert_called_once_with('Test Book', 'Test Author', '1234567890')
+
+def test_update_book(library_system, book_manager_mock, inputs):
+    """
+    Test updating a book in the library system.
+
+    This test verifies that a book's information can be updated correctly by calling the book manager's update_book method.
+    """
+    inputs(['1234567890', 'New Title', 'New Author'])
+    book_manager_mock.update_book.return_value = MagicMock()
+    library_system.update_book()
+    book_manager_mock.update_book.assert_called_once_with('1234567890', 'New Title', 'New Author')
+
+def test_delete_book(library_system, book_manager_mock, inputs):
+    """
+    Test deleting a book from the library system.
+
+    This test verifies that a book can be deleted correctly by calling the book manager's delete_book method.
+    """
+    inputs(['1234567890'])
+    library_system.delete_book()
+    book_manager_mock.delete_book.assert_called_once_with('1234567890')
+
+def test_list_books(library_system, book_manager_mock, capsys):
+    """
+    Test listing all books in the library system.
+
+    This test verifies that the list of books is correctly retrieved and displayed, showing their availability status.
+    """
+    book_manager_mock.list_books.return_value = [_Item("Book 1"), _Item("Book 2", available=False)]
+    
+    library_system.list_books()
+    out = _lines(capsys.readouterr().out)
+    assert "Book 1 - Status: Available ✅" in out
+    assert "Book 2 - Status: Checked Out ❌" in out
+
+def test_add_user(library_system, user_manager_mock, inputs):
+    """
+    Test adding a user to the library system.
+
+    This test verifies that a user can be added correctly by calling the user manager's add_user method.
+    """
+    inputs(['Test User'])
+    user_manager_mock.add_user.return_value = MagicMock()
+    library_system.add_user()
+    user_manager_mock.add_user.assert_called_once_with('Test User')
+
+def test_update_user(library_system, user_manager_mock, inputs):
+    """
+    Test updating a user in the library system.
+
+    This test verifies that a user's information can be updated correctly by calling the user manager's update_user method.
+    """
+    inputs(['1', 'New Name'])
+    user_manager_mock.update_user.return_value = MagicMock()
+    library_system.update_user()
+    user_manager_mock.update_user.assert_called_once_with('1', 'New Name')
+
+def test_delete_user(library_system, user_manager_mock, inputs):
+    """
+    Test deleting a user from the library system.
+
+    This test verifies that a user can be deleted correctly by calling the user manager's delete_user method.
+    """
+    inputs(['1'])
+    library_system.delete_user()
+    user_manager_mock.delete_user.assert_called_once_with('1')
+
+def test_list_users(library_system, user_manager_mock, capsys):
+    """
+    Test listing all users in the library system.
+
+    This test verifies that the list of users is correctly retrieved and displayed.
+    """
+    user_manager_mock.list_users.return_value = [_Item("User 1"), _Item("User 2")]
+    
+    library_system.list_users()
+    out = _lines(capsys.readouterr().out)
+    assert "User 1" in out
+    assert "User 2" in out
+
+def test_checkout_book(library_system, checkout_manager_mock, inputs):
+    """
+    Test checking out a book from the library system.
+
+    This test verifies that a book can be checked out correctly by calling the checkout manager's checkout_book method.
+    """
+    inputs(['1', '1234567890'])
+    checkout_manager_mock.checkout_book.return_value = MagicMock()
+    library_system.checkout_book()
+    checkout_manager_mock.checkout_book.assert_called_once_with('1', '1234567890')
+
+def test_return_book(library_system, checkout_manager_mock, inputs):
+    """
+    Test returning a book to the library system.
+
+    This test verifies that a book can be returned correctly by calling the checkout manager's return_book method.
+    """
+    inputs(['1234567890'])
+    library_system.return_book()
+    checkout_manager_mock.return_book.assert_called_once_with('1234567890')
+
+def test_search_book(library_system, book_manager_mock, inputs, capsys):
+    """
+    Test searching for a book in the library system.
+
+    This test verifies that a book can be found correctly by calling the book manager's get_book_by_isbn method.
+    """
+    inputs(['1', '1234567890'])
+    book_manager_mock.get_book_by_isbn.return_value = _Item("Test Book")
+    
+    library_system.search_book()
+    out = _lines(capsys.readouterr().out)
+    assert "Book found: Test Book" in out
+
+def test_search_user(library_system, user_manager_mock, inputs, capsys):
+    """
+    Test searching for a user in the library system.
+
+    This test verifies that a user can be found correctly by calling the user manager's get_user_by_id method.
+    """
+    inputs(['1', '1'])
+    user_manager_mock.get_user_by_id.return_value = _Item("Test User")
+    
+    library_system.search_user()
+    out = _lines(capsys.readouterr().out)
+    assert "User found: Test User" in out
 
 if __name__ == '__main__':
-    unittest.main()
+    pytest.main([__file__])
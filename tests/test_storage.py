@@ -0,0 +1,216 @@
+"""
+Unit tests for the storage classes.
+
+These tests run against real files under pytest's tmp_path, ensuring that data
+is written atomically, unchanged data is not rewritten, and records survive a
+round trip with either JSON encoder.
+"""
+import json
+import os
+import pytest
+from library import storage
+from library.storage import LogStorage, Storage
+
+# Data with nesting and non-ASCII text, to catch encoder differences
+_DATA = [
+    {"title": "Cien años de soledad", "author": "Gabriel García Márquez", "isbn": "1234567890", "available": True},
+    {"title": "Test Book", "author": "Test Author", "isbn": "2222222222", "available": False},
+]
+
+@pytest.fixture(params=["orjson", "json"])
+def encoder(request, monkeypatch):
+    """
+    Run the test once with orjson and once with the stdlib json fallback.
+    """
+    if request.param == "orjson":
+        if storage.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(storage, "orjson", None)
+    return request.param
+
+def _age(path):
+    """
+    Move a file's modification time into the past, so a later write is detectable.
+    """
+    os.utime(path, ns=(0, 0))
+
+def test_save_and_load_round_trip(tmp_path, encoder):
+    """
+    Test saving data and loading it back.
+
+    This test verifies that the loaded data equals the saved data and that no
+    temporary file is left behind after the atomic write.
+    """
+    path = tmp_path / "books.json"
+    Storage(str(path)).save_data(_DATA)
+    assert Storage(str(path)).load_data() == _DATA
+    assert not os.path.exists(str(path) + ".tmp")
+
+def test_file_is_readable_by_either_encoder(tmp_path, encoder):
+    """
+    Test that a saved file is plain JSON.
+
+    This test verifies that a file written with either encoder can be read by the
+    stdlib json module, so switching encoders never strands existing data.
+    """
+    path = tmp_path / "books.json"
+    Storage(str(path)).save_data(_DATA)
+    assert json.loads(path.read_bytes()) == _DATA
+
+def test_save_identical_data_skips_write(tmp_path, encoder):
+    """
+    Test saving the same data twice.
+
+    This test verifies that the second save leaves the file untouched.
+    """
+    path = tmp_path / "books.json"
+    store = Storage(str(path))
+    store.save_data(_DATA)
+    _age(path)
+    store.save_data(list(_DATA))
+    assert os.stat(path).st_mtime_ns == 0
+
+def test_save_after_load_skips_write(tmp_path, encoder):
+    """
+    Test saving data that was just loaded.
+
+    This test verifies that loading a file records its contents, so saving the
+    same data straight back does not rewrite the file.
+    """
+    path = tmp_path / "books.json"
+    Storage(str(path)).save_data(_DATA)
+    _age(path)
+    store = Storage(str(path))
+    store.save_data(store.load_data())
+    assert os.stat(path).st_mtime_ns == 0
+
+def test_save_after_file_deleted_rewrites(tmp_path, encoder):
+    """
+    Test saving unchanged data after the file was deleted.
+
+    This test verifies that the skip only applies while the file still exists.
+    """
+    path = tmp_path / "books.json"
+    store = Storage(str(path))
+    store.save_data(_DATA)
+    os.remove(path)
+    store.save_data(_DATA)
+    assert Storage(str(path)).load_data() == _DATA
+
+def test_save_changed_data_writes(tmp_path, encoder):
+    """
+    Test saving data that differs from what was last written.
+
+    This test verifies that the file is rewritten with the new data.
+    """
+    path = tmp_path / "books.json"
+    store = Storage(str(path))
+    store.save_data(_DATA)
+    _age(path)
+    store.save_data(_DATA[:1])
+    assert os.stat(path).st_mtime_ns != 0
+    assert Storage(str(path)).load_data() == _DATA[:1]
+
+@pytest.mark.parametrize("content", [b"", b"  \n"], ids=["empty", "whitespace"])
+def test_load_empty_file(tmp_path, content):
+    """
+    Test loading a file with no data.
+
+    This test verifies that an empty or whitespace-only file loads as an empty list.
+    """
+    path = tmp_path / "books.json"
+    path.write_bytes(content)
+    assert Storage(str(path)).load_data() == []
+
+def test_load_missing_file(tmp_path):
+    """
+    Test loading from a file that does not exist.
+
+    This test verifies that a missing file loads as an empty list.
+    """
+    assert Storage(str(tmp_path / "missing.json")).load_data() == []
+
+def test_in_memory_storage():
+    """
+    Test saving and loading with in-memory storage.
+
+    This test verifies that ':memory:' storage keeps the data without touching any file.
+    """
+    store = Storage(':memory:')
+    store.save_data(_DATA)
+    assert store.load_data() == _DATA
+
+def test_log_append_and_load(tmp_path, encoder):
+    """
+    Test appending records to a log file and loading them back.
+
+    This test verifies that each appended record is written as its own line
+    and that records load in the order they were appended.
+    """
+    path = tmp_path / "checkouts.jsonl"
+    log = LogStorage(str(path))
+    log.append_data(_DATA[:1])
+    log.append_data(_DATA[1:])
+    log.append_data([])
+    assert path.read_bytes().count(b"\n") == 2
+    assert LogStorage(str(path)).load_data() == _DATA
+
+def test_log_save_replaces_records(tmp_path, encoder):
+    """
+    Test rewriting a log file with save_data.
+
+    This test verifies that save_data replaces all appended records and that
+    no temporary file is left behind.
+    """
+    path = tmp_path / "checkouts.jsonl"
+    log = LogStorage(str(path))
+    log.append_data(_DATA)
+    log.save_data(_DATA[1:])
+    assert LogStorage(str(path)).load_data() == _DATA[1:]
+    assert not os.path.exists(str(path) + ".tmp")
+
+def test_log_load_drops_partial_last_line(tmp_path):
+    """
+    Test loading a log whose last append was cut short.
+
+    This test verifies that the partial record is skipped and cut from the file,
+    so that records appended afterwards are loaded intact.
+    """
+    path = tmp_path / "checkouts.jsonl"
+    log = LogStorage(str(path))
+    log.append_data(_DATA[:1])
+    with open(path, "ab") as f:
+        f.write(b'{"op": "in", "book_is')
+    assert log.load_data() == _DATA[:1]
+    log.append_data(_DATA[1:])
+    assert LogStorage(str(path)).load_data() == _DATA
+
+def test_log_load_keeps_unterminated_last_line(tmp_path):
+    """
+    Test loading a log whose complete last record is missing its newline.
+
+    This test verifies that the record is kept and terminated, so that records
+    appended afterwards start on a new line.
+    """
+    path = tmp_path / "checkouts.jsonl"
+    path.write_bytes(json.dumps(_DATA[0]).encode())
+    log = LogStorage(str(path))
+    assert log.load_data() == _DATA[:1]
+    log.append_data(_DATA[1:])
+    assert LogStorage(str(path)).load_data() == _DATA
+
+def test_log_load_rejects_corrupt_middle_line(tmp_path):
+    """
+    Test loading a log with a corrupt record before its last line.
+
+    This test verifies that only a partial last line is tolerated; corruption
+    elsewhere still raises instead of silently dropping records.
+    """
+    path = tmp_path / "checkouts.jsonl"
+    path.write_bytes(b'{"op": "in"\n' + json.dumps(_DATA[0]).encode() + b"\n")
+    with pytest.raises(ValueError):
+        LogStorage(str(path)).load_data()
+
+if __name__ == '__main__':
+    pytest.main([__file__])